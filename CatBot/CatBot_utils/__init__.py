@@ -5,27 +5,94 @@ Package containing various utility functions for CatBot's internal workings.
 
 # pylint: disable=invalid-name
 
-from . import emojis
-from .bot_init import (
-    CAT_API_SEARCH_LINK,
-    LOG_FILE,
-    LOGGING_CHANNEL,
-    MANAGEMENT_ROLES,
-    MODERATOR_ROLES,
-    VERSION,
-    config_logging,
-    get_cat_api_key_from_env,
-    get_token,
-    handle_app_command_error,
-    initialize_bot,
-    initialize_cli_arg_parser,
-)
-from .confirm_button import ConfirmButton
-from .internal_utils import (
-    DEFAULT_EMBED_COLOR,
-    START_TIME,
-    TIME_MULTIPLICATION_TABLE,
-    TimeUnit,
-    generate_authored_embed_with_icon,
-    wrap_reason,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+# Attributes are imported from their submodules on first access (PEP 562),
+# so importing one utility doesn't pull in discord.py, requests, etc. for all of them.
+_LAZY_ATTRIBUTES = {
+    "emojis": "",
+    "CAT_API_SEARCH_LINK": "bot_init",
+    "LOG_FILE": "bot_init",
+    "LOGGING_CHANNEL": "bot_init",
+    "MANAGEMENT_ROLES": "bot_init",
+    "MODERATOR_ROLES": "bot_init",
+    "VERSION": "bot_init",
+    "config_logging": "bot_init",
+    "get_cat_api_key_from_env": "bot_init",
+    "get_token": "bot_init",
+    "handle_app_command_error": "bot_init",
+    "initialize_bot": "bot_init",
+    "initialize_cli_arg_parser": "bot_init",
+    "ConfirmButton": "confirm_button",
+    "DEFAULT_EMBED_COLOR": "internal_utils",
+    "START_TIME": "internal_utils",
+    "TIME_MULTIPLICATION_TABLE": "internal_utils",
+    "TimeUnit": "internal_utils",
+    "generate_authored_embed_with_icon": "internal_utils",
+    "generate_icon_file": "internal_utils",
+    "wrap_reason": "internal_utils",
+}
+
+if TYPE_CHECKING:
+    from . import emojis
+    from .bot_init import (
+        CAT_API_SEARCH_LINK,
+        LOG_FILE,
+        LOGGING_CHANNEL,
+        MANAGEMENT_ROLES,
+        MODERATOR_ROLES,
+        VERSION,
+        config_logging,
+        get_cat_api_key_from_env,
+        get_token,
+        handle_app_command_error,
+        initialize_bot,
+        initialize_cli_arg_parser,
+    )
+    from .confirm_button import ConfirmButton
+    from .internal_utils import (
+        DEFAULT_EMBED_COLOR,
+        START_TIME,
+        TIME_MULTIPLICATION_TABLE,
+        TimeUnit,
+        generate_authored_embed_with_icon,
+        generate_icon_file,
+        wrap_reason,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import and return a package attribute on first access (PEP 562).
+
+    :param name: Name of the attribute being accessed
+    :type name: str
+    :raises AttributeError: If the attribute does not exist
+    :return: The attribute's value
+    :rtype: Any
+    """
+
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    submodule = _LAZY_ATTRIBUTES[name]
+    if submodule:
+        value = getattr(import_module(f".{submodule}", __name__), name)
+    else:  # The attribute is a submodule itself
+        value = import_module(f".{name}", __name__)
+
+    # Cache the value so later accesses skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """
+    List the package's attributes, including those not yet imported.
+
+    :return: Attribute names
+    :rtype: list[str]
+    """
+
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES))
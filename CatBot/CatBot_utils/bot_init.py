@@ -3,28 +3,150 @@ bot_init.py
 Bot initialization code.
 """
 
+import atexit
 import logging
-from argparse import ArgumentParser
-
-import discord
-from discord import app_commands
-from discord.ext.commands import Bot
-from requests import Timeout
-
-from .logging_formatting import LOGGING_FORMAT, ColorFormatter
+import re
+from argparse import ArgumentParser, Namespace
+from functools import lru_cache
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from queue import SimpleQueue
+from threading import Event, Thread
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from .logging_formatting import COLOR_FORMATTER, LOGGING_FORMAT
+
+# discord.py and requests are heavy to import, so they are only imported
+# inside the functions that need them (or on attribute access, see __getattr__).
+# This keeps paths such as `--help` from paying for them.
+if TYPE_CHECKING:
+    import discord
+    from discord.ext.commands import Bot
 
 LOG_FILE = "logs.log"
-DEFAULT_EMBED_COLOR = discord.Color(int("ffffff", 16))
+LOG_BUFFER_CAPACITY = 64
+DEFAULT_LOG_FLUSH_INTERVAL = 5.0
 LOGGING_CHANNEL = 1306045987319451718
 MANAGEMENT_ROLES = ("Owner", "Management")
 MODERATOR_ROLES = ("Owner", "Management", "Mod")
 CAT_API_SEARCH_LINK = "https://api.thecatapi.com/v1/images/search"
-APP_COMMAND_ERRORS = (
-    app_commands.errors.CheckFailure,
-    discord.Forbidden,
-    OverflowError,
-    Timeout,
-)
+_ENV_VARIABLE_PATTERN = re.compile(r"^(\w+)=(.*)$", re.MULTILINE)
+
+# Maps each supported/expected app command error type to
+# (logging level, log message, response message).
+# Log messages are formatted with the user who invoked the command.
+_app_command_error_handlers: Optional[Dict[type, Tuple[int, str, str]]] = None
+
+
+def _get_app_command_error_handlers() -> Dict[type, Tuple[int, str, str]]:
+    """
+    Get the handlers for supported/expected app command errors,
+    importing the modules defining the errors on first use.
+
+    :return: Handlers keyed by error type
+    :rtype: Dict[type, Tuple[int, str, str]]
+    """
+
+    global _app_command_error_handlers  # pylint: disable=global-statement
+
+    if _app_command_error_handlers is None:
+        # pylint: disable=import-outside-toplevel
+        import discord
+        from discord import app_commands
+        from requests import Timeout
+
+        _app_command_error_handlers = {
+            app_commands.errors.CheckFailure: (
+                logging.INFO,
+                "Unauthorized user %s attempted to use a restricted command",
+                "You do not have permission to use this command.",
+            ),
+            discord.Forbidden: (
+                logging.WARNING,
+                "Command invoked by %s was attempted "
+                + "with inadequate permissions allotted to the bot",
+                "I do not have permissions to perform this command.",
+            ),
+            OverflowError: (
+                logging.INFO,
+                "Overflow error occurred during a calculation invoked by %s",
+                "This calculation caused an arithmetic overflow. "
+                + "Try using smaller numbers.",
+            ),
+            Timeout: (
+                logging.WARNING,
+                "Timeout error occurred during HTTP request invoked by %s",
+                "An attempt to communicate with an external API "
+                + "has taken too long, and has been canceled.",
+            ),
+        }
+
+    return _app_command_error_handlers
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Lazily resolve constants that depend on discord.py (PEP 562).
+
+    :param name: Name of the attribute being accessed
+    :type name: str
+    :raises AttributeError: If the attribute does not exist
+    :return: The attribute's value
+    :rtype: Any
+    """
+
+    if name == "DEFAULT_EMBED_COLOR":
+        # pylint: disable=import-outside-toplevel
+        from .internal_utils import DEFAULT_EMBED_COLOR
+
+        return DEFAULT_EMBED_COLOR
+    if name == "APP_COMMAND_ERRORS":
+        return frozenset(_get_app_command_error_handlers())
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class BufferedLogHandler(MemoryHandler):
+    """
+    Log handler that buffers records before writing them to its target.
+    The buffer is flushed when it is full, when a WARNING or higher record arrives,
+    and every `flush_interval` seconds by a background thread.
+    """
+
+    def __init__(self, target: logging.Handler, flush_interval: float) -> None:
+        """
+        Log handler that buffers records before writing them to its target.
+
+        :param target: Handler to flush buffered records to
+        :type target: logging.Handler
+        :param flush_interval: Maximum number of seconds between flushes
+        :type flush_interval: float
+        """
+
+        super().__init__(LOG_BUFFER_CAPACITY, flushLevel=logging.WARNING, target=target)
+        self.flush_interval = flush_interval
+        self._stop_flushing = Event()
+        # Flushes on a timer, so records are written even while the bot is idle
+        self._flush_thread = Thread(
+            target=self._flush_periodically, name="log-flusher", daemon=True
+        )
+        self._flush_thread.start()
+
+    def _flush_periodically(self) -> None:
+        """
+        Flush the buffer every `flush_interval` seconds until the handler is closed.
+        """
+
+        while not self._stop_flushing.wait(self.flush_interval):
+            self.flush()
+
+    def close(self) -> None:
+        """
+        Stop the flush thread, then flush and close the handler.
+        """
+
+        self._stop_flushing.set()
+        self._flush_thread.join()
+        super().close()
 
 
 def get_version() -> str:
@@ -35,102 +157,190 @@ def get_version() -> str:
     :rtype: str
     """
 
-    with open("changelog.md", encoding="utf8") as file:
-        line = file.readline()
-        while not line.startswith("## v"):
-            line = file.readline()
+    with open("changelog.md", "rb") as file:
+        changelog = file.read()
 
-        return line.split(" ")[1].strip()
+    # Find the first version header in a single scan instead of line by line
+    if changelog.startswith(b"## v"):
+        start = 0
+    else:
+        start = changelog.find(b"\n## v") + 1
+        if not start:
+            raise ValueError("changelog.md does not contain a version header")
+
+    end = changelog.find(b"\n", start)
+    header = changelog[start:] if end == -1 else changelog[start:end]
+    return header.split(b" ")[1].strip().decode("utf8")
 
 
 VERSION = get_version()
 
 
-def initialize_bot() -> Bot:
+@lru_cache(maxsize=2)
+def _get_intents(member_intents: bool, /) -> "discord.Intents":
+    """
+    Get the gateway intents CatBot uses.
+    Built once per configuration, since only the member intents vary.
+
+    :param member_intents: Whether to enable the members and presences intents
+    :type member_intents: bool
+    :return: Intents
+    :rtype: discord.Intents
+    """
+
+    import discord  # pylint: disable=import-outside-toplevel
+
+    intents = discord.Intents.default()
+    # CatBot only uses slash commands, so typing events are never needed
+    intents.typing = False
+    intents.dm_typing = False
+    intents.members = member_intents
+    intents.presences = member_intents
+    return intents
+
+
+def initialize_bot(*, member_intents: bool = True) -> "Bot":
     """
     Initialize and return the bot.
+    Only the gateway intents CatBot uses are enabled.
 
+    :param member_intents: Whether to enable the members and presences intents,
+    which /member-count relies on, defaults to True
+    :type member_intents: bool, optional
     :return: Bot
     :rtype: Bot
     """
 
-    intents = discord.Intents.default()
-    intents.message_content = True
-    intents.members = True
-    intents.presences = True
-    return Bot(command_prefix="!", intents=intents)
+    from discord.ext.commands import Bot  # pylint: disable=import-outside-toplevel
 
+    return Bot(command_prefix="!", intents=_get_intents(member_intents))
 
-def initialize_cli_arg_parser() -> ArgumentParser:
+
+def _add_logging_args(parser: ArgumentParser, /) -> None:
     """
-    Initialize the CLI arg parser and return it.
+    Add the logging CLI args to the parser.
 
-    :return: Arg parser
-    :rtype: argparse.ArgumentParser
+    :param parser: Parser to add the args to
+    :type parser: ArgumentParser
     """
 
-    parser = ArgumentParser(description="Run CatBot with optional logging arguments")
-    parser.add_argument(
+    group = parser.add_argument_group("logging")
+    group.add_argument(
         "--logfile",
         type=str,
         help="Path to the file where logs will be written, defaults to 'logs.log'",
     )
-    parser.add_argument(
+    group.add_argument(
         "--nostreamlogging", action="store_true", help="Disable console logging"
     )
-    parser.add_argument(
+    group.add_argument(
+        "--coloredlogs",
+        action="store_true",
+        help="Launch the terminal in colored logging mode",
+    )
+    group.add_argument(
+        "--logflushinterval",
+        type=float,
+        default=DEFAULT_LOG_FLUSH_INTERVAL,
+        help="Maximum number of seconds file logs are buffered before being written, "
+        + f"defaults to {DEFAULT_LOG_FLUSH_INTERVAL}",
+    )
+
+
+def _add_bot_args(parser: ArgumentParser, /) -> None:
+    """
+    Add the bot startup CLI args to the parser.
+
+    :param parser: Parser to add the args to
+    :type parser: ArgumentParser
+    """
+
+    group = parser.add_argument_group("bot")
+    group.add_argument(
         "--tokenoverride",
         type=str,
         help="New token to override the default token, "
         + "primarily for testing under a different app than the main app",
     )
-    parser.add_argument(
+    group.add_argument(
         "--testing", action="store_true", help="Launch the bot in testing mode"
     )
-    parser.add_argument(
-        "--coloredlogs",
+    group.add_argument(
+        "--nomemberintents",
         action="store_true",
-        help="Launch the terminal in colored logging mode",
+        help="Disable the members and presences intents to reduce gateway traffic, "
+        + "at the cost of /member-count accuracy",
     )
 
+
+@lru_cache(maxsize=1)
+def initialize_cli_arg_parser() -> ArgumentParser:
+    """
+    Initialize the CLI arg parser and return it.
+    The parser is only built once; later calls return the same parser.
+
+    :return: Arg parser
+    :rtype: argparse.ArgumentParser
+    """
+
+    parser = ArgumentParser(description="Run CatBot with optional logging arguments")
+    _add_logging_args(parser)
+    _add_bot_args(parser)
+
     return parser
 
 
+def _read_env_variable(name: str, /) -> str:
+    """
+    Read a variable from the .env file.
+
+    :param name: Name of the variable
+    :type name: str
+    :raises ValueError: If the variable is not defined in the .env file
+    :return: The variable's value, without surrounding quotes
+    :rtype: str
+    """
+
+    with open(".env", encoding="utf8") as file:
+        env = file.read()
+
+    # Scan the whole file at once rather than reading it line by line
+    for match in _ENV_VARIABLE_PATTERN.finditer(env):
+        if match[1] == name:
+            return match[2].strip().strip('"')
+
+    raise ValueError(f"{name} is not defined in the .env file")
+
+
+@lru_cache(maxsize=1)
 def get_token_from_env() -> str:
     """
     Get CatBot's token from the .env file.
+    The .env file is only read once per process; use
+    get_token_from_env.cache_clear() to read it again.
 
     :return: CatBot token
     :rtype: str
     """
 
-    with open(".env", encoding="utf8") as file:
-        line = file.readline()
-        while not line.startswith("TOKEN="):
-            line = file.readline()
-        index = line.find("=")
-
-    return line[index + 1 :].strip().strip('"')
+    return _read_env_variable("TOKEN")
 
 
+@lru_cache(maxsize=1)
 def get_cat_api_key_from_env() -> str:
     """
     Get CatBot's Cat API key from the .env file.
+    The .env file is only read once per process; use
+    get_cat_api_key_from_env.cache_clear() to read it again.
 
     :return: Cat API key
     :rtype: str
     """
 
-    with open(".env", encoding="utf8") as file:
-        line = file.readline()
-        while not line.startswith("CAT_API_KEY="):
-            line = file.readline()
-        index = line.find("=")
-
-    return line[index + 1 :].strip().strip('"')
+    return _read_env_variable("CAT_API_KEY")
 
 
-def config_logging(parser: ArgumentParser, /) -> None:
+def config_logging(args: Namespace, /) -> None:
     """
     Config logging settings using command-line arguments.
 
@@ -139,55 +349,72 @@ def config_logging(parser: ArgumentParser, /) -> None:
     --testing {store_true}
     --nostreamlogging {store_true}
     --coloredlogs {store_true}
+    --logflushinterval {float}
 
     Defaults are:
     --logfile logs.log
+    --logflushinterval 5.0
 
-    :param parser: ArgumentParser to get arg values from
-    :type parser: ArgumentParser
+    :param args: Parsed CLI args to get arg values from
+    :type args: Namespace
     """
 
-    args = parser.parse_args()
     log_file = args.logfile if args.logfile else LOG_FILE
-    if args.nostreamlogging:
-        handlers = [logging.FileHandler(log_file)]
-    else:
+    # The file is only opened once the first record is written to it
+    fh = logging.FileHandler(log_file, delay=True)
+    fh.setFormatter(logging.Formatter(LOGGING_FORMAT))
+    buffered_handler = BufferedLogHandler(fh, args.logflushinterval)
+    handlers = [buffered_handler]
+    if not args.nostreamlogging:
         sh = logging.StreamHandler()
-        if args.coloredlogs:
-            sh.setFormatter(ColorFormatter())
-        handlers = [
-            logging.FileHandler(log_file),
-            sh,  # type: ignore
-        ]
-
-    logging.basicConfig(
-        level=logging.INFO,
-        format=LOGGING_FORMAT,
-        handlers=handlers,  # type: ignore
-    )
+        sh.setFormatter(
+            COLOR_FORMATTER if args.coloredlogs else logging.Formatter(LOGGING_FORMAT)
+        )
+        handlers.append(sh)  # type: ignore
+
+    # Records are only queued on the calling thread (usually the event loop);
+    # formatting and I/O happen on the listener's thread.
+    log_queue: SimpleQueue = SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+
+    def stop_logging() -> None:
+        """
+        Write out all queued and buffered records and stop the logging threads.
+        """
+
+        listener.stop()
+        buffered_handler.close()
+
+    atexit.register(stop_logging)
+
+    qh = QueueHandler(log_queue)
+    # Only merge the message with its args here, the listener's handlers do the rest
+    qh.setFormatter(logging.Formatter("%(message)s"))
+
+    logging.basicConfig(level=logging.INFO, handlers=[qh])
 
     logging.info(
         "Logging config: logfile=%s, nostreamlogging=%s", log_file, args.nostreamlogging
     )
 
 
-def get_token(parser: ArgumentParser, /) -> str:
+def get_token(args: Namespace, /) -> str:
     """
     Get the token to use depending on whether
     --tokenoverride was passed to this module.
 
-    :param parser: Argument parser to get arg values from
-    :type parser: ArgumentParser
+    :param args: Parsed CLI args to get arg values from
+    :type args: Namespace
     :return: Token
     :rtype: str
     """
 
-    args = parser.parse_args()
     return args.tokenoverride if args.tokenoverride else get_token_from_env()
 
 
 async def handle_app_command_error(
-    interaction: discord.Interaction, error: Exception
+    interaction: "discord.Interaction", error: Exception
 ) -> None:
     """
     Handle an app command error.
@@ -199,6 +426,10 @@ async def handle_app_command_error(
     :type error: AppCommandError | Exception
     """
 
+    # pylint: disable=import-outside-toplevel
+    import discord
+    from discord import app_commands
+
     async def try_response(message: str, ephemeral: bool = True) -> None:
         """
         Attempt to respond with the given message.
@@ -210,39 +441,38 @@ async def handle_app_command_error(
         :type ephemeral: bool, optional
         """
 
+        # Checking is_done() avoids raising and catching InteractionResponded
+        if interaction.response.is_done():
+            send = interaction.followup.send
+        else:
+            send = interaction.response.send_message
+
         try:
-            await interaction.response.send_message(message, ephemeral=ephemeral)
-        except discord.errors.InteractionResponded:
-            await interaction.followup.send(message, ephemeral=ephemeral)
+            await send(message, ephemeral=ephemeral)
+        except discord.HTTPException as e:  # e.g. the interaction token expired
+            logging.warning("Failed to respond to an app command error: %s", e)
+
+    # Errors raised inside a command's callback arrive wrapped by discord.py
+    if isinstance(error, app_commands.CommandInvokeError):
+        error = error.original
+
+    handlers = _get_app_command_error_handlers()
+    # Most errors are direct instances of a supported type, so try an exact lookup
+    # before walking the error's MRO to find the closest supported base class
+    handler = handlers.get(type(error))
+    if handler is None:
+        handler = next(
+            (handlers[cls] for cls in type(error).__mro__ if cls in handlers),
+            None,
+        )
 
-    if error not in APP_COMMAND_ERRORS:  # Unintentional error
+    if handler is None:  # Unintentional error
         logging.error("An error occurred: %s", error)
         await try_response(
             "An unknown error occurred. Contact @zentiph to report this please!"
         )
+        return
 
-    if isinstance(error, app_commands.errors.CheckFailure):  # Restricted command
-        logging.info(
-            "Unauthorized user %s attempted to use a restricted command",
-            interaction.user,
-        )
-        await try_response("You do not have permission to use this command.")
-
-    elif isinstance(error, discord.Forbidden):
-        logging.warning(
-            "Attempted to perform a command with inadequate permissions allotted to the bot"
-        )
-        await try_response("I do not have permissions to perform this command.")
-
-    elif isinstance(error, OverflowError):
-        logging.info("Overflow error occurred during a calculation")
-        await try_response(
-            "This calculation caused an arithmetic overflow. Try using smaller numbers."
-        )
-
-    elif isinstance(error, Timeout):
-        logging.warning("Timeout error occurred during HTTP request")
-        await try_response(
-            "An attempt to communicate with an external API "
-            + "has taken too long, and has been canceled."
-        )
+    level, log_message, response = handler
+    logging.log(level, log_message, interaction.user)
+    await try_response(response)
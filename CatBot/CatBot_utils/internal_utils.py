@@ -4,12 +4,13 @@ Utilities for internal functions such as embed creation.
 """
 
 from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
 from typing import Any, Literal, Optional, Union, Tuple
 
 import discord
 
-# We redefine this here to prevent circular import
-DEFAULT_EMBED_COLOR = discord.Color(int("ffffff", 16))
+DEFAULT_EMBED_COLOR = discord.Color(0xFFFFFF)
 START_TIME = datetime.now()
 TimeUnit = Literal["seconds", "minutes", "hours", "days"]
 TIME_MULTIPLICATION_TABLE = {
@@ -20,6 +21,23 @@ TIME_MULTIPLICATION_TABLE = {
 }
 
 
+@lru_cache(maxsize=512)
+def _reason_prefix(caller_name: str, caller_id: int) -> str:
+    """
+    Build and cache the prefix wrap_reason adds for a caller.
+    Moderators tend to run many commands, so the same prefix is reused often.
+
+    :param caller_name: Name of the command caller
+    :type caller_name: str
+    :param caller_id: ID of the command caller
+    :type caller_id: int
+    :return: Reason prefix
+    :rtype: str
+    """
+
+    return f"@{caller_name} (ID={caller_id}): "
+
+
 def wrap_reason(reason: str, caller: Union[discord.Member, discord.User]) -> str:
     """
     Wrap reason to include the caller's name and ID in the reason (for admin logging purposes).
@@ -32,7 +50,50 @@ def wrap_reason(reason: str, caller: Union[discord.Member, discord.User]) -> str
     :rtype: str
     """
 
-    return f"@{caller.name} (ID={caller.id}): {reason}"
+    return _reason_prefix(caller.name, caller.id) + reason
+
+
+@lru_cache(maxsize=8)
+def _read_icon_bytes(icon_filepath: str) -> bytes:
+    """
+    Validate, read, and cache the contents of an icon file.
+    The bytes are cached rather than a discord.File, since a File is consumed when sent.
+    Since the result is cached, each path is only validated the first time it's used.
+
+    :param icon_filepath: Filepath to the icon
+    :type icon_filepath: str
+    :raises ValueError: If the file is not a .jpg, .jpeg, or .png file
+    :return: The icon's contents
+    :rtype: bytes
+    """
+
+    if not icon_filepath.lower().endswith((".jpg", ".jpeg", ".png")):
+        raise ValueError("Image filepath should be a .jpg or .png file")
+
+    with open(icon_filepath, "rb") as file:
+        return file.read()
+
+
+def generate_icon_file(
+    *,
+    icon_filepath: str = "CatBot/images/profile.jpg",
+    icon_filename: str = "image.png",
+) -> discord.File:
+    """
+    Generate the icon file an authored embed refers to.
+    A new file is needed each time an embed is sent, even if the embed itself is reused.
+
+    :param icon_filepath: Filepath to the icon, defaults to "CatBot/images/profile.jpg"
+    :type icon_filepath: str, optional
+    :param icon_filename: Filename of the icon, defaults to "image.png"
+    :type icon_filename: str, optional
+    :return: The icon file
+    :rtype: discord.File
+    """
+
+    return discord.File(
+        BytesIO(_read_icon_bytes(icon_filepath)), filename=icon_filename
+    )
 
 
 # pylint: disable=too-many-arguments
@@ -64,18 +125,7 @@ def generate_authored_embed_with_icon(
     :rtype: Tuple[discord.Embed, discord.File]
     """
 
-    if not any(
-        (
-            (
-                icon_filepath.endswith(".jpg"),
-                icon_filepath.endswith(".jpeg"),
-                icon_filepath.endswith(".png"),
-            )
-        )
-    ):
-        raise ValueError("Image filepath should be a .jpg or .png file")
-
-    file = discord.File(icon_filepath, filename=icon_filename)
+    file = generate_icon_file(icon_filepath=icon_filepath, icon_filename=icon_filename)
 
     embed = discord.Embed(
         title=embed_title,
@@ -4,6 +4,8 @@ Logging formatting code.
 """
 
 import logging
+from types import MappingProxyType
+from typing import Final, Mapping
 
 LOGGING_FORMAT = (
     "%(asctime)s | [%(levelname)s] %(name)s - %(message)s (%(filename)s:%(lineno)d)"
@@ -22,13 +24,30 @@ class ColorFormatter(logging.Formatter):
     FATAL = "\x1b[38;2;255;0;0m" + "\x1b[1m"  # red in bold
     RESET = "\x1b[0m"
 
-    FORMATS = {
-        logging.DEBUG: DEBUG + LOGGING_FORMAT + RESET,
-        logging.INFO: INFO + LOGGING_FORMAT + RESET,
-        logging.WARNING: WARNING + LOGGING_FORMAT + RESET,
-        logging.ERROR: ERROR + LOGGING_FORMAT + RESET,
-        logging.CRITICAL: FATAL + LOGGING_FORMAT + RESET,
-    }
+    # Built once when the class is defined, and read-only so it can't drift
+    # from the formatters built from it in __init__
+    FORMATS: Final[Mapping[int, str]] = MappingProxyType(
+        {
+            logging.DEBUG: DEBUG + LOGGING_FORMAT + RESET,
+            logging.INFO: INFO + LOGGING_FORMAT + RESET,
+            logging.WARNING: WARNING + LOGGING_FORMAT + RESET,
+            logging.ERROR: ERROR + LOGGING_FORMAT + RESET,
+            logging.CRITICAL: FATAL + LOGGING_FORMAT + RESET,
+        }
+    )
+
+    def __init__(self, *args, **kwargs) -> None:
+        """
+        Custom color formatter for logging stream outputs.
+        A formatter is built once for each level so it can be reused for every record.
+        """
+
+        super().__init__(*args, **kwargs)
+        self._formatters = {
+            levelno: logging.Formatter(log_fmt)
+            for levelno, log_fmt in self.FORMATS.items()
+        }
+        self._fallback_formatter = logging.Formatter()
 
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -40,6 +59,9 @@ class ColorFormatter(logging.Formatter):
         :rtype: str
         """
 
-        log_fmt = self.FORMATS.get(record.levelno)
-        formatter = logging.Formatter(log_fmt)
+        formatter = self._formatters.get(record.levelno, self._fallback_formatter)
         return formatter.format(record)
+
+
+# Formatters hold no per-record state, so a single instance is shared
+COLOR_FORMATTER: Final[ColorFormatter] = ColorFormatter()
@@ -9,6 +9,8 @@ __all__ = [
     "CMD_CALL",
     "COMMAND_CALL",
     "DEBUG",
+    "DEFAULT_BATCH_SIZE",
+    "DEFAULT_FLUSH_INTERVAL",
     "DEFAULT_FORMAT",
     "DEFAULT_TIMESTAMP_FORMAT",
     "ERROR",
@@ -42,10 +44,13 @@ __all__ = [
     "warning",
 ]
 
+from . import pawprints
 from .pawprints import (
     CMD_CALL,
     COMMAND_CALL,
     DEBUG,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_FLUSH_INTERVAL,
     DEFAULT_FORMAT,
     DEFAULT_TIMESTAMP_FORMAT,
     ERROR,
@@ -73,8 +78,25 @@ from .pawprints import (
     info,
     log,
     reset_root,
-    root,
     setup,
     warn,
     warning,
 )
+
+
+def __getattr__(name):
+    """
+    Get package attributes that are created on first access (PEP 562).
+    The root Logger is only created once it is first used.
+
+    :param name: Name of the attribute being accessed
+    :type name: str
+    :raises AttributeError: If the attribute does not exist
+    :return: The attribute's value
+    :rtype: Any
+    """
+
+    if name == "root":
+        return pawprints.root
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
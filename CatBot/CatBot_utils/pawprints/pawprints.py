@@ -3,66 +3,84 @@ pawprints.py
 Main file for the pawprints library.
 """
 
+import os
 from abc import abstractmethod
-from inspect import FrameInfo, stack
+from functools import lru_cache
+from atexit import register as register_atexit
 from io import TextIOBase, SEEK_END
-from os.path import basename
-from sys import stderr
-from time import gmtime, strftime, time
-from typing import Dict, List
-
+from locale import getpreferredencoding
+from string import Formatter as _StringFormatter
+from sys import _getframe, stderr
+from threading import Event, Lock, RLock, Thread
+from time import gmtime, monotonic, strftime, time_ns
+from typing import Dict, List, NamedTuple, Optional
+from weakref import WeakSet, WeakValueDictionary
 
 DEFAULT_FORMAT = "[{ftime}] [{level}] {name} - {message} ({filename}:{lineno})"
 DEFAULT_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
-_OPEN_TEXT_WRITING_MODES = (
-    "r+",
-    "+r",
-    "rt+",
-    "r+t",
-    "+rt",
-    "tr+",
-    "t+r",
-    "+tr",
-    "w+",
-    "+w",
-    "wt+",
-    "w+t",
-    "+wt",
-    "tw+",
-    "t+w",
-    "+tw",
-    "a+",
-    "+a",
-    "at+",
-    "a+t",
-    "+at",
-    "ta+",
-    "t+a",
-    "+ta",
-    "x+",
-    "+x",
-    "xt+",
-    "x+t",
-    "+xt",
-    "tx+",
-    "t+x",
-    "+tx",
-    "w",
-    "wt",
-    "tw",
-    "a",
-    "at",
-    "ta",
-    "x",
-    "xt",
-    "tx",
+DEFAULT_BATCH_SIZE = 64 * 1024
+DEFAULT_FLUSH_INTERVAL = 1.0
+_OPEN_TEXT_WRITING_MODES = frozenset(
+    {
+        "r+",
+        "+r",
+        "rt+",
+        "r+t",
+        "+rt",
+        "tr+",
+        "t+r",
+        "+tr",
+        "w+",
+        "+w",
+        "wt+",
+        "w+t",
+        "+wt",
+        "tw+",
+        "t+w",
+        "+tw",
+        "a+",
+        "+a",
+        "at+",
+        "a+t",
+        "+at",
+        "ta+",
+        "t+a",
+        "+ta",
+        "x+",
+        "+x",
+        "xt+",
+        "x+t",
+        "+xt",
+        "tx+",
+        "t+x",
+        "+tx",
+        "w",
+        "wt",
+        "tw",
+        "a",
+        "at",
+        "ta",
+        "x",
+        "xt",
+        "tx",
+    }
 )
 
-_loggers: Dict[int, "Logger"] = {}
-_loggers_by_name: Dict[str, "Logger"] = {}
-_outputs: Dict[int, "_LoggerOutput"] = {}
+# Loggers are keyed by name only; lookups by id are rare and scan this instead
+_loggers: Dict[str, "Logger"] = {}
+# Outputs are held weakly so one that is no longer used anywhere can be collected
+_outputs: "WeakValueDictionary[int, _LoggerOutput]" = WeakValueDictionary()
+# Open FileOutputs, flushed by a single shared thread and closed by a single atexit hook
+_file_outputs: "WeakSet[FileOutput]" = WeakSet()
+# Reentrant since a dropped output may be closed by __del__ while it's held
+_file_outputs_lock = RLock()
+_file_outputs_changed = Event()
+_file_output_flusher: List[Optional[Thread]] = [None]
+_ROOT_LOGGER_ID = 0
+_LINESEP = os.linesep
 # We define these as lists so we can access them anywhere without use of 'global'
-_most_recent_logger_id: List[int] = [-1]
+# Logger id _ROOT_LOGGER_ID is reserved for the root Logger
+_most_recent_logger_id: List[int] = [0]
 _most_recent_output_id: List[int] = [-1]
 
 
@@ -71,10 +89,6 @@ def _generate_new_logger_id():
     Generate a new logger id based on existing loggers.
     """
 
-    if _most_recent_logger_id[0] == -1:  # Not yet initialized
-        _most_recent_logger_id[0] = 0
-        return 0
-
     _most_recent_logger_id[0] += 1
     return _most_recent_logger_id[0]
 
@@ -92,10 +106,14 @@ def _generate_new_output_id():
     return _most_recent_output_id[0]
 
 
-def _try_to_string(obj, /):
+# Builtins and module globals used by hot functions are bound as default args
+# so they are loaded as fast locals rather than looked up as globals on every call.
+
+
+def _try_to_string(obj, /, *, _str=str, _repr=repr):
     """
-    Attempt to convert the object to a str.
-    Return the stringified object if successful, otherwise return False.
+    Attempt to convert the object to a str, falling back to its repr.
+    Return the stringified object if successful, otherwise return None.
 
     :param obj: Object to attempt to convert
     :type obj: object
@@ -103,11 +121,13 @@ def _try_to_string(obj, /):
     :rtype: str | None
     """
 
-    if hasattr(obj, "__str__"):
-        return str(obj)
-    if hasattr(obj, "__repr__"):
-        return repr(obj)
-    return None
+    try:
+        return _str(obj)
+    except Exception:  # pylint: disable=broad-exception-caught
+        try:
+            return _repr(obj)
+        except Exception:  # pylint: disable=broad-exception-caught
+            return None
 
 
 def get_logger(*args):
@@ -127,6 +147,10 @@ def get_logger(*args):
             f"get_logger takes 1 or 2 positional arguments but {len(args)} were given"
         )
 
+    # The root Logger is created on first use, so create it before it's looked up
+    if _ROOT_LOGGER_ID in args or "root" in args:
+        _get_root()
+
     if len(args) == 2:
         id, name = args[0], args[1]  # pylint: disable=redefined-builtin
 
@@ -135,17 +159,19 @@ def get_logger(*args):
         if not isinstance(name, str):
             raise TypeError("name must be a str")
 
-        logger_from_id = _loggers.get(id, None)
-        if logger_from_id is not None and logger_from_id.name == name:
-            return logger_from_id
+        logger_from_name = _loggers.get(name, None)
+        if logger_from_name is not None and logger_from_name.id == id:
+            return logger_from_name
 
         return None  # No Logger with the id and name given exists
 
     # elif len(args) == 1
     if isinstance(args[0], int):  # Arg is an id
-        return _loggers.get(args[0], None)
+        return next(
+            (logger for logger in _loggers.values() if logger.id == args[0]), None
+        )
     if isinstance(args[0], str):  # Arg is a name
-        return _loggers_by_name.get(args[0], None)
+        return _loggers.get(args[0], None)
 
     raise TypeError("when given 1 positional argument, get_logger takes an int or str")
 
@@ -156,6 +182,13 @@ class _NoLogLevelSentinel:
     """
 
     __slots__ = ()
+    _instance = None
+
+    def __new__(cls):
+        # There is only ever one sentinel, so it can be compared by identity
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
 
     def __eq__(self, other):
         return isinstance(other, _NoLogLevelSentinel)
@@ -226,9 +259,28 @@ _level_number_to_name = {
     6: "ERROR",
     7: "FATAL",
 }
-
-
-def get_level(level, /):
+# Level names indexed by level number, for branch-free number to name conversion
+_LEVEL_NAMES = ("",) + tuple(_level_number_to_name[number] for number in range(1, 8))
+
+
+# Maps every accepted level (numbers, and names in common casings) to its number,
+# so most get_level calls are a single dict lookup
+_level_lookup = {number: number for number in _level_number_to_name}
+for _name, _number in _level_name_to_number.items():
+    _level_lookup[_name] = _number
+    _level_lookup[_name.lower()] = _number
+    _level_lookup[_name.title()] = _number
+del _name, _number
+
+
+def get_level(
+    level,
+    /,
+    *,
+    _isinstance=isinstance,
+    _str=str,
+    _lookup=_level_lookup,
+):
     """
     Get the numeric logging level from the given level.
     The given value can be an int or a str.
@@ -239,14 +291,17 @@ def get_level(level, /):
     :rtype: int | None
     """
 
-    if not isinstance(level, (int, str)):
-        raise TypeError("level must be an int or str")
-
-    if isinstance(level, str):
-        return _level_name_to_number.get(level.upper(), None)
+    try:
+        levelno = _lookup.get(level)
+    except TypeError:  # Unhashable, so definitely not a valid level
+        levelno = None
+    if levelno is not None:
+        return levelno
 
-    if 1 <= level <= 7:
-        return level
+    if _isinstance(level, _str):  # Names in any other casing
+        return _lookup.get(level.upper(), None)
+    if not _isinstance(level, int):
+        raise TypeError("level must be an int or str")
     return None
 
 
@@ -265,7 +320,7 @@ def get_level_name(level, /):
         raise TypeError("level must be an int or str")
 
     if isinstance(level, int):
-        return _level_number_to_name.get(level, None)
+        return _LEVEL_NAMES[level] if 1 <= level <= 7 else None
 
     if level in (
         "DEBUG",
@@ -282,12 +337,126 @@ def get_level_name(level, /):
     return None
 
 
+_template_parser = _StringFormatter()
+# Expressions used to access each formatting variable in a compiled template
+_TEMPLATE_FIELD_EXPRESSIONS = {
+    "message": "message.message",
+    "level": "message.level",
+    "levelno": "message.levelno",
+    "name": "message.logger_name",
+    "filepath": "message.filepath",
+    "filename": "message.filename",
+    "module": "message.module",
+    "lineno": "message.lineno",
+    "time": "message.time",
+    "ftime": "ftime",
+}
+_TEMPLATE_CONVERSIONS = {"s": "str", "r": "repr", "a": "ascii"}
+_TEMPLATE_BUILTINS = {"format": format, "str": str, "repr": repr, "ascii": ascii}
+
+
+def _compile_template(template, end="", /):
+    """
+    Compile a Formatter template into a function taking a LogMessage
+    and its formatted time, so the template doesn't need to be parsed on every log.
+    The terminating string is baked into the compiled function.
+    Templates using anything other than formatting variables with optional
+    conversions and static format specs are not compiled.
+
+    :param template: Template to compile
+    :type template: str
+    :param end: Terminating string to append to each formatted message, defaults to ""
+    :type end: str, optional
+    :return: The compiled template, or None if the template could not be compiled,
+    and whether the template uses {ftime}
+    :rtype: Tuple[Callable[[LogMessage, str | None], str] | None, bool]
+    """
+
+    try:
+        parsed = list(_template_parser.parse(template))
+    except ValueError:  # Malformed template, let str.format raise the error
+        return None, True
+
+    parts = []
+    uses_ftime = False
+    for literal, field_name, format_spec, conversion in parsed:
+        if literal:
+            parts.append(repr(literal))
+        if field_name is None:
+            continue
+
+        expression = _TEMPLATE_FIELD_EXPRESSIONS.get(field_name)
+        if expression is None or "{" in format_spec:
+            return None, True
+        if conversion:
+            if conversion not in _TEMPLATE_CONVERSIONS:
+                return None, True
+            expression = f"{_TEMPLATE_CONVERSIONS[conversion]}({expression})"
+
+        uses_ftime = uses_ftime or field_name == "ftime"
+        parts.append(f"format({expression}, {format_spec!r})")
+    if end:
+        parts.append(repr(end))
+
+    # Only known field expressions and repr'd literals make it into the source,
+    # so evaluating it is safe.
+    # The parts are joined in one go rather than concatenated one by one,
+    # which would create an intermediate str for every part.
+    source = (
+        "lambda message, ftime: ''.join(("
+        + "".join(f"{part}, " for part in parts)
+        + "))"
+    )
+    compiled = eval(  # pylint: disable=eval-used
+        source, {"__builtins__": _TEMPLATE_BUILTINS}
+    )
+    return compiled, uses_ftime
+
+
+@lru_cache(maxsize=256)
+def _split_filepath(filepath, /):
+    """
+    Get the file name and module name from a filepath.
+    Handles both / and \\ separators regardless of platform.
+    Results are cached, since logs tend to come from the same few files.
+
+    :param filepath: Filepath to split
+    :type filepath: str
+    :return: The file name and module name
+    :rtype: Tuple[str, str]
+    """
+
+    filename = filepath.rpartition("/")[2].rpartition("\\")[2]
+    return filename, filename.removesuffix(".py")
+
+
+class _FrameLocation(NamedTuple):
+    """
+    The location of a log call in the source code.
+    A lightweight alternative to inspect.FrameInfo.
+    """
+
+    filename: str
+    lineno: int
+
+
 class LogMessage:  # pylint: disable=too-many-instance-attributes
     """
     Log message class.
     Essentially a string with extra stored information to improve time accuracy.
     """
 
+    __slots__ = (
+        "__message",
+        "__levelno",
+        "__logger_name",
+        "__filepath",
+        "__filename",
+        "__lineno",
+        "__module",
+        "__time_ns",
+    )
+
     def __init__(
         self,
         message,
@@ -306,11 +475,12 @@ class LogMessage:  # pylint: disable=too-many-instance-attributes
         :type level: int | str
         :param logger_name: Name of the logger
         :type logger_name: str
-        :param stack_frame: The stack frame where the log call was made
-        :type stack_frame: inspect.FrameInfo
+        :param stack_frame: The stack frame where the log call was made;
+        any object with filename and lineno attributes is accepted
+        :type stack_frame: inspect.FrameInfo | pawprints._FrameLocation
         """
 
-        current_time = time()
+        current_time_ns = time_ns()
 
         message = _try_to_string(message)
         if message is None:
@@ -320,18 +490,16 @@ class LogMessage:  # pylint: disable=too-many-instance-attributes
             raise ValueError("level must be a valid logging level (1-7)")
         if not isinstance(logger_name, str):
             raise TypeError("logger_name must be a str")
-        if not isinstance(stack_frame, FrameInfo):
-            raise TypeError("stack_frame must be an inspect.FrameInfo")
+        if not (hasattr(stack_frame, "filename") and hasattr(stack_frame, "lineno")):
+            raise TypeError("stack_frame must have filename and lineno attributes")
 
         self.__message = message
         self.__levelno = level
-        self.__level = get_level_name(self.__levelno)
         self.__logger_name = logger_name
         self.__filepath = stack_frame.filename
-        self.__filename = self.__filepath.split("\\")[-1]
+        self.__filename, self.__module = _split_filepath(self.__filepath)
         self.__lineno = stack_frame.lineno
-        self.__module = basename(self.__filepath).removesuffix(".py")
-        self.__time = current_time
+        self.__time_ns = current_time_ns
 
     @property
     def message(self):
@@ -347,7 +515,7 @@ class LogMessage:  # pylint: disable=too-many-instance-attributes
         The name of this LogMessage's logging level.
         """
 
-        return self.__level
+        return _LEVEL_NAMES[self.__levelno]
 
     @property
     def levelno(self):
@@ -403,7 +571,15 @@ class LogMessage:  # pylint: disable=too-many-instance-attributes
         The time.time() value generated when this LogMessage was created.
         """
 
-        return self.__time
+        return self.__time_ns / 1e9
+
+    @property
+    def time_ns(self):
+        """
+        The time.time_ns() value generated when this LogMessage was created.
+        """
+
+        return self.__time_ns
 
 
 class Formatter:
@@ -411,6 +587,16 @@ class Formatter:
     Formatter for log messages.
     """
 
+    __slots__ = (
+        "__template",
+        "__compiled_template",
+        "__uses_ftime",
+        "__timestamp_format",
+        "__end",
+        "__ftime_cache_second",
+        "__ftime_cache",
+    )
+
     def __init__(self, template, timestamp_format=DEFAULT_TIMESTAMP_FORMAT, end="\n"):
         """
         Formatter for log messages.
@@ -446,6 +632,11 @@ class Formatter:
         self.__template = template
         self.__timestamp_format = timestamp_format
         self.__end = end
+        self.__compiled_template, self.__uses_ftime = _compile_template(template, end)
+        # Timestamps only have whole-second resolution,
+        # so the most recent one is cached for logs made in the same second
+        self.__ftime_cache_second = -1
+        self.__ftime_cache = ""
 
     def format(self, message, /):
         """
@@ -460,6 +651,11 @@ class Formatter:
         if not isinstance(message, LogMessage):
             raise TypeError("message must be a pawprints.LogMessage")
 
+        compiled_template = self.__compiled_template
+        if compiled_template is not None:
+            ftime = self.__format_time(message.time_ns) if self.__uses_ftime else None
+            return compiled_template(message, ftime)
+
         return (
             self.__template.format(
                 message=message.message,
@@ -471,11 +667,28 @@ class Formatter:
                 module=message.module,
                 lineno=message.lineno,
                 time=message.time,
-                ftime=strftime(self.__timestamp_format, gmtime(message.time)),
+                ftime=self.__format_time(message.time_ns),
             )
             + self.__end
         )
 
+    def __format_time(self, time_ns_, /):
+        """
+        Format a time.time_ns() value using this Formatter's timestamp format.
+
+        :param time_ns_: Time to format, in nanoseconds
+        :type time_ns_: int
+        :return: The formatted time
+        :rtype: str
+        """
+
+        second = time_ns_ // 1_000_000_000
+        if second != self.__ftime_cache_second:
+            self.__ftime_cache = strftime(self.__timestamp_format, gmtime(second))
+            self.__ftime_cache_second = second
+
+        return self.__ftime_cache
+
     @property
     def template(self):
         """
@@ -490,6 +703,7 @@ class Formatter:
             raise TypeError("template must be a str")
 
         self.__template = new
+        self.__compiled_template, self.__uses_ftime = _compile_template(new, self.__end)
 
     @property
     def timestamp_format(self):
@@ -505,6 +719,7 @@ class Formatter:
             raise TypeError("timestamp_format must be a str")
 
         self.__timestamp_format = new
+        self.__ftime_cache_second = -1
 
     @property
     def end(self):
@@ -520,6 +735,9 @@ class Formatter:
             raise TypeError("end must be a str")
 
         self.__end = new
+        self.__compiled_template, self.__uses_ftime = _compile_template(
+            self.__template, new
+        )
 
 
 default_formatter = Formatter(DEFAULT_FORMAT)
@@ -530,6 +748,8 @@ class _LoggerOutput:  # pylint: disable=too-few-public-methods
     Base class for logger output streams.
     """
 
+    __slots__ = ("__id", "__weakref__")
+
     def __init__(self):
         """
         Base class for logger output streams.
@@ -564,21 +784,32 @@ class StreamOutput(_LoggerOutput):
     Stream output handler for loggers.
     """
 
-    def __init__(self, stream=stderr, /):
+    __slots__ = ("__stream", "__auto_flush", "__line_buffered")
+
+    def __init__(self, stream=stderr, /, *, auto_flush=True):
         """
         Stream output handler for loggers.
 
         :param stream: Stream to send the logger output to, defaults to sys.stderr
         :type stream: TextIO, optional
+        :param auto_flush: Whether to flush the stream after each message;
+        if False, messages are flushed by the stream itself or by calling flush(),
+        defaults to True
+        :type auto_flush: bool, optional
         """
 
         if not isinstance(stream, TextIOBase):
             raise TypeError("stream must be a TextIO")
         if not stream.writable():
             raise ValueError("stream is not writeable")
+        if not isinstance(auto_flush, bool):
+            raise TypeError("auto_flush must be a bool")
 
         super().__init__()
         self.__stream = stream
+        self.__auto_flush = auto_flush
+        # Line buffered streams (like sys.stderr) already flush when a newline is written
+        self.__line_buffered = getattr(stream, "line_buffering", False)
 
     def send(self, message, /):
         """
@@ -590,7 +821,15 @@ class StreamOutput(_LoggerOutput):
 
         stream = self.__stream
         stream.write(message)
-        stream.flush()
+        if self.__auto_flush and not (self.__line_buffered and "\n" in message):
+            stream.flush()
+
+    def flush(self):
+        """
+        Flush the output stream.
+        """
+
+        self.__stream.flush()
 
     @property
     def stream(self):
@@ -600,15 +839,77 @@ class StreamOutput(_LoggerOutput):
 
         return self.__stream
 
+    @property
+    def auto_flush(self):
+        """
+        Whether this StreamOutput flushes its stream after each message.
+        """
+
+        return self.__auto_flush
+
+
+def _get_open_flags(mode, /):
+    """
+    Get the os.open flags matching a text writing mode.
+
+    :param mode: Text writing mode
+    :type mode: pawprints.TextWritingMode
+    :return: The flags to pass to os.open
+    :rtype: int
+    """
+
+    flags = os.O_RDWR if "+" in mode else os.O_WRONLY
+    # Newlines are translated before writing, so stop Windows from translating them again
+    flags |= getattr(os, "O_BINARY", 0)
+    if "w" in mode:
+        flags |= os.O_CREAT | os.O_TRUNC
+    elif "a" in mode:
+        flags |= os.O_CREAT | os.O_APPEND
+    elif "x" in mode:
+        flags |= os.O_CREAT | os.O_EXCL
+
+    return flags
+
 
 class FileOutput(_LoggerOutput):
     """
     File output handler for loggers.
     """
 
-    def __init__(self, filepath, mode="a", encoding=None, errors=None):
+    __slots__ = (
+        "__filepath",
+        "__mode",
+        "__encoding",
+        "__errors",
+        "__batch_size",
+        "__flush_interval",
+        "__write_encoding",
+        "__write_errors",
+        "__fd",
+        "__buffer",
+        "__buffered_chars",
+        "__unwritten",
+        "__lock",
+        "__closed",
+        "__next_flush",
+    )
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        filepath,
+        mode="a",
+        encoding=None,
+        errors=None,
+        *,
+        batch_size=DEFAULT_BATCH_SIZE,
+        flush_interval=DEFAULT_FLUSH_INTERVAL,
+    ):
         """
         File output handler for loggers.
+        Log messages are buffered and written in batches, either once the buffer
+        holds `batch_size` characters or every `flush_interval` seconds.
+        The file is opened here and kept open until close() is called.
 
         :param filepath: Path to the file to write to
         :type filepath: str
@@ -618,6 +919,12 @@ class FileOutput(_LoggerOutput):
         :type encoding: str | None, optional
         :param errors: Specification regarding encoding error handling, defaults to None
         :type errors: str, optional
+        :param batch_size: Number of buffered characters that triggers a write,
+        defaults to DEFAULT_BATCH_SIZE
+        :type batch_size: int, optional
+        :param flush_interval: Maximum number of seconds a message stays buffered,
+        defaults to DEFAULT_FLUSH_INTERVAL
+        :type flush_interval: float, optional
         """
 
         if not isinstance(filepath, str):
@@ -630,30 +937,154 @@ class FileOutput(_LoggerOutput):
             raise TypeError("encoding must be a str or None")
         if errors is not None and not isinstance(errors, str):
             raise TypeError("errors must be a str or None")
+        if not isinstance(batch_size, int):
+            raise TypeError("batch_size must be an int")
+        if not isinstance(flush_interval, (int, float)):
+            raise TypeError("flush_interval must be an int or float")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be greater than 0")
 
-        super().__init__()
         self.__filepath = filepath
         self.__mode = mode
         self.__encoding = encoding
         self.__errors = errors
+        self.__batch_size = batch_size
+        self.__flush_interval = flush_interval
+
+        # The file is written to with os.write on a raw file descriptor,
+        # so text is encoded here the same way a text mode file would encode it
+        self.__write_encoding = (
+            encoding if encoding is not None else getpreferredencoding(False)
+        )
+        self.__write_errors = errors if errors is not None else "strict"
+        self.__buffer = []
+        self.__buffered_chars = 0
+        # Encoded bytes a failed write didn't get out, written before anything else
+        self.__unwritten = b""
+        self.__lock = Lock()
+        self.__closed = Event()
+        self.__next_flush = monotonic() + flush_interval
+
+        # Opening here makes an invalid path or mode fail now, rather than on a write
+        self.__fd = None
+        self.__open(mode)
+
+        # Only register the output once it's usable
+        super().__init__()
+        _register_file_output(self)
+
+    def __del__(self):
+        """
+        Flush and close the output file if this FileOutput is dropped without being closed.
+        """
+
+        if not self.__closed.is_set():
+            self.close()
+
+    def __open(self, mode, /):
+        """
+        Open the output file.
+
+        :param mode: Text writing mode to open the file with
+        :type mode: pawprints.TextWritingMode
+        """
+
+        fd = os.open(self.__filepath, _get_open_flags(mode), 0o644)
+        os.lseek(fd, 0, SEEK_END)
+        self.__fd = fd
+
+    def _flush_if_due(self, now, /):
+        """
+        Flush the buffer if flush_interval seconds have passed since the last
+        periodic flush. Called by the shared flusher thread.
+
+        :param now: Current time, from time.monotonic()
+        :type now: float
+        :return: Seconds until the next periodic flush is due
+        :rtype: float
+        """
+
+        if now >= self.__next_flush:
+            try:
+                self.flush()
+            except OSError as e:
+                # The messages stay buffered, so keep retrying instead of
+                # letting the flusher thread die
+                stderr.write(
+                    f"pawprints: failed to write to {self.__filepath!r}: {e}\n"
+                )
+            self.__next_flush = now + self.__flush_interval
+        return self.__next_flush - now
+
+    def __write_buffer(self):
+        """
+        Write the buffered messages to the output file.
+        Must be called while holding the lock.
+        """
+
+        if not self.__buffer and not self.__unwritten:
+            return
+        if self.__fd is None:  # Closed, so append rather than reapplying the mode
+            self.__open("a")
+
+        if self.__buffer:
+            text = "".join(self.__buffer)
+            if _LINESEP != "\n":  # Translate newlines like a text mode file would
+                text = text.replace("\n", _LINESEP)
+            self.__unwritten += text.encode(self.__write_encoding, self.__write_errors)
+            self.__buffer.clear()
+            self.__buffered_chars = 0
+
+        data = memoryview(self.__unwritten)
+        try:
+            # os.write may write less than it was given, so write until everything is out
+            while data:
+                data = data[os.write(self.__fd, data) :]  # type: ignore
+        finally:
+            # If a write failed, only keep what wasn't written so a retry can't
+            # write anything twice
+            self.__unwritten = data.tobytes()
+
+        if self.__closed.is_set():
+            os.close(self.__fd)  # type: ignore
+            self.__fd = None
 
     def send(self, message, /):
         """
-        Write a log message to the output file.
+        Buffer a log message to be written to the output file.
 
         :param message: Message to send
         :type message: SupportsStr | SupportsRepr
         """
 
-        with open(
-            self.__filepath, self.__mode, encoding=self.__encoding, errors=self.__errors
-        ) as file:
-            if not file.writable():
-                raise ValueError(f"file '{self.__filepath}' is not writable")
+        with self.__lock:
+            self.__buffer.append(message)
+            self.__buffered_chars += len(message)
+            if self.__buffered_chars >= self.__batch_size or self.__closed.is_set():
+                self.__write_buffer()
+
+    def flush(self):
+        """
+        Write all buffered messages to the output file.
+        """
+
+        with self.__lock:
+            self.__write_buffer()
+
+    def close(self):
+        """
+        Flush any buffered messages and close the output file.
+        Messages sent after closing are written immediately without buffering.
+        """
 
-            file.seek(0, SEEK_END)
-            file.write(message)
-            file.flush()
+        self.__closed.set()
+        with _file_outputs_lock:
+            _file_outputs.discard(self)
+        with self.__lock:
+            self.__write_buffer()
+            if self.__fd is not None:
+                os.close(self.__fd)
+                self.__fd = None
 
     @property
     def filepath(self):
@@ -687,12 +1118,100 @@ class FileOutput(_LoggerOutput):
 
         return self.__errors
 
+    @property
+    def batch_size(self):
+        """
+        The number of buffered characters that triggers a write.
+        """
+
+        return self.__batch_size
+
+    @property
+    def flush_interval(self):
+        """
+        The maximum number of seconds a message stays buffered.
+        """
+
+        return self.__flush_interval
+
+
+def _register_file_output(output, /):
+    """
+    Register an open FileOutput with the shared flusher thread,
+    starting the thread and the atexit hook on first use.
+
+    :param output: FileOutput to register
+    :type output: FileOutput
+    """
+
+    with _file_outputs_lock:
+        _file_outputs.add(output)
+        if _file_output_flusher[0] is None:
+            thread = Thread(
+                target=_flush_file_outputs_periodically,
+                name="pawprints-flusher",
+                daemon=True,
+            )
+            _file_output_flusher[0] = thread
+            thread.start()
+            register_atexit(_close_file_outputs)
+    # The new output may be due before the flusher's current wait ends
+    _file_outputs_changed.set()
+
+
+def _flush_due_file_outputs():
+    """
+    Flush every open FileOutput whose flush interval has passed.
+
+    :return: Seconds until the next flush is due, or None if no outputs are open
+    :rtype: float | None
+    """
+
+    with _file_outputs_lock:
+        outputs = list(_file_outputs)
+    now = monotonic()
+    return min((output._flush_if_due(now) for output in outputs), default=None)
+
+
+def _flush_file_outputs_periodically():
+    """
+    Flush open FileOutputs as their flush intervals pass, for the life of the process.
+    """
+
+    while True:
+        # The outputs are only referenced inside _flush_due_file_outputs,
+        # so waiting here doesn't keep a dropped output alive
+        _file_outputs_changed.clear()
+        timeout = _flush_due_file_outputs()
+        _file_outputs_changed.wait(timeout)
+
+
+def _close_file_outputs():
+    """
+    Close every open FileOutput, writing out anything still buffered.
+    """
+
+    with _file_outputs_lock:
+        outputs = list(_file_outputs)
+    for output in outputs:
+        output.close()
+
 
 class Logger:  # pylint: disable=too-many-instance-attributes
     """
     A basic logger that can be used for one logging stream.
     """
 
+    __slots__ = (
+        "__id",
+        "__name",
+        "__level",
+        "__enabled",
+        "__formatter",
+        "__outputs",
+        "__output_sends",
+    )
+
     def __init__(self, name, level):
         """
         A basic logger that can be used for one logging stream.
@@ -709,53 +1228,82 @@ class Logger:  # pylint: disable=too-many-instance-attributes
         if level is None:
             raise ValueError("level must be a valid logging level (1-7)")
 
-        if name in _loggers_by_name:
+        if name in _loggers:
             raise ValueError(
                 f"a logger has already been initialized with name '{name}'"
             )
 
-        self.__id = _generate_new_logger_id()
-        _loggers[self.__id] = self
+        self.__id = _ROOT_LOGGER_ID if name == "root" else _generate_new_logger_id()
         self.__name = name
-        _loggers_by_name[self.__name] = self
+        _loggers[self.__name] = self
 
         self.__level = level
         self.__enabled = True
         self.__formatter = default_formatter
-        self.__outputs = []
+        # Outputs are keyed by id, so they can be removed without a scan
+        self.__outputs = {}
+        # Bound send methods of the outputs, kept in sync with __outputs
+        # so logging doesn't look up each output's send method per log
+        self.__output_sends = ()
+
+    def __refresh_output_sends(self):
+        """
+        Rebuild the cached bound send methods from this Logger's outputs.
+        """
+
+        self.__output_sends = tuple(output.send for output in self.__outputs.values())
 
-    def __log(self, message, level, /):
+    def __log(
+        self,
+        message,
+        level,
+        /,
+        *,
+        _to_string=_try_to_string,
+        _get_frame=_getframe,
+        _log_message=LogMessage,
+        _frame_location=_FrameLocation,
+    ):
         """
         Log the given message with the given level.
 
         :param message: Message to log
         :type message: SupportsStr | SupportsRepr
-        :param level: Logging level
-        :type level: int | str
+        :param level: Numeric logging level, already validated by the caller
+        :type level: int
         """
 
-        message = _try_to_string(message)
-        if message is None:
-            raise TypeError("message must be a str or support __str__ or __repr__")
-        level = get_level(level)
-        if level is None:
-            raise ValueError("level must be a valid logging level (1-7)")
-
-        if not self.__enabled:
+        # Reject the log before doing any work on the message
+        if not self.__enabled or self.__level > level:
             return
-        if self.__level > level:
+        # Nothing would receive the log, so don't bother creating it
+        sends = self.__output_sends
+        if not sends:
             return
 
+        message = _to_string(message)
+        if message is None:
+            raise TypeError("message must be a str or support __str__ or __repr__")
+
         # Right here is level 1,
         # above that is where __log was called, which is level 2,
         # and above that is where a log function was called, which is level 3 and what we want.
         stack_level = 3
 
-        log_message = LogMessage(message, level, self.__name, stack()[stack_level])
+        frame = _get_frame(stack_level)
+        log_message = _log_message(
+            message,
+            level,
+            self.__name,
+            _frame_location(frame.f_code.co_filename, frame.f_lineno),
+        )
         out_message = self.__formatter.format(log_message)
 
-        for output_handler in self.__outputs:
-            output_handler.send(out_message)
+        if len(sends) == 1:
+            sends[0](out_message)
+            return
+        for send in sends:
+            send(out_message)
 
     def log(self, message, level=NO_LEVEL_SET, /):
         """
@@ -768,12 +1316,61 @@ class Logger:  # pylint: disable=too-many-instance-attributes
         :type level: int | str | pawprints._NoLogLevelSentinel, optional
         """
 
-        if level == NO_LEVEL_SET:
+        if level is NO_LEVEL_SET:
             level = self.__level
+        else:
+            level = get_level(level)
+            if level is None:
+                raise ValueError("level must be a valid logging level (1-7)")
 
         self.__log(message, level)
 
-    def debug(self, message, /):
+    def lazy_log(self, message_factory, level=NO_LEVEL_SET, /):
+        """
+        Create a log with the message returned by message_factory and the given level.
+        message_factory is only called if the log will actually be created,
+        so expensive messages cost nothing when the level is disabled.
+        If level is left as NO_LEVEL_SET, it will default to this Logger's set level.
+
+        :param message_factory: Callable taking no arguments that returns the message to log
+        :type message_factory: Callable[[], SupportsStr | SupportsRepr]
+        :param level: Logging level to use, defaults to NO_LEVEL_SET
+        :type level: int | str | pawprints._NoLogLevelSentinel, optional
+        """
+
+        if not callable(message_factory):
+            raise TypeError("message_factory must be callable")
+
+        if level is NO_LEVEL_SET:
+            level = self.__level
+        else:
+            level = get_level(level)
+            if level is None:
+                raise ValueError("level must be a valid logging level (1-7)")
+
+        if not self.__enabled or self.__level > level or not self.__output_sends:
+            return
+
+        self.__log(message_factory(), level)
+
+    def is_enabled_for(self, level, /):
+        """
+        Determine whether this Logger would create a log with the given level.
+        Useful for guarding the construction of expensive log messages.
+
+        :param level: Logging level
+        :type level: int | str
+        :return: Whether a log with the given level would be created
+        :rtype: bool
+        """
+
+        levelno = get_level(level)
+        if levelno is None:
+            raise ValueError("level must be a valid logging level (1-7)")
+
+        return self.__enabled and self.__level <= levelno
+
+    def debug(self, message, /, *, _level=DEBUG):
         """
         Create a DEBUG level log with the given message.
 
@@ -781,9 +1378,9 @@ class Logger:  # pylint: disable=too-many-instance-attributes
         :type message: SupportsStr | SupportsRepr
         """
 
-        self.__log(message, DEBUG)
+        self.__log(message, _level)
 
-    def command_call(self, message, /):
+    def command_call(self, message, /, *, _level=CMD_CALL):
         """
         Create a CMD_CALL level log with the given message.
 
@@ -791,11 +1388,11 @@ class Logger:  # pylint: disable=too-many-instance-attributes
         :type message: SupportsStr | SupportsRepr
         """
 
-        self.__log(message, CMD_CALL)
+        self.__log(message, _level)
 
     cmd_call = command_call
 
-    def info(self, message, /):
+    def info(self, message, /, *, _level=INFO):
         """
         Create an INFO level log with the given message.
 
@@ -803,9 +1400,9 @@ class Logger:  # pylint: disable=too-many-instance-attributes
         :type message: SupportsStr | SupportsRepr
         """
 
-        self.__log(message, INFO)
+        self.__log(message, _level)
 
-    def setup(self, message, /):
+    def setup(self, message, /, *, _level=SETUP):
         """
         Create a SETUP level log with the given message.
 
@@ -813,9 +1410,9 @@ class Logger:  # pylint: disable=too-many-instance-attributes
         :type message: SupportsStr | SupportsRepr
         """
 
-        self.__log(message, SETUP)
+        self.__log(message, _level)
 
-    def warning(self, message, /):
+    def warning(self, message, /, *, _level=WARNING):
         """
         Create a WARNING level log with the given message.
 
@@ -823,11 +1420,11 @@ class Logger:  # pylint: disable=too-many-instance-attributes
         :type message: SupportsStr | SupportsRepr
         """
 
-        self.__log(message, WARNING)
+        self.__log(message, _level)
 
     warn = warning
 
-    def error(self, message, /):
+    def error(self, message, /, *, _level=ERROR):
         """
         Create an ERROR level log with the given message.
 
@@ -835,9 +1432,9 @@ class Logger:  # pylint: disable=too-many-instance-attributes
         :type message: SupportsStr | SupportsRepr
         """
 
-        self.__log(message, ERROR)
+        self.__log(message, _level)
 
-    def fatal(self, message, /):
+    def fatal(self, message, /, *, _level=FATAL):
         """
         Create a FATAL level log with the given message.
 
@@ -845,7 +1442,7 @@ class Logger:  # pylint: disable=too-many-instance-attributes
         :type message: SupportsStr | SupportsRepr
         """
 
-        self.__log(message, FATAL)
+        self.__log(message, _level)
 
     def add_output(self, output, /):
         """
@@ -856,12 +1453,14 @@ class Logger:  # pylint: disable=too-many-instance-attributes
         """
 
         if isinstance(output, _LoggerOutput):
-            self.__outputs.append(output)
+            self.__outputs[output.id] = output
+            self.__refresh_output_sends()
             return
 
         if isinstance(output, int):
             if output_object := _outputs.get(output, None):
-                self.__outputs.append(output_object)
+                self.__outputs[output] = output_object
+                self.__refresh_output_sends()
                 return
             raise ValueError(f"_LoggerOutput id '{output}' was not found")
 
@@ -880,25 +1479,22 @@ class Logger:  # pylint: disable=too-many-instance-attributes
         """
 
         if isinstance(arg, _LoggerOutput):
-            if arg in self.__outputs:
-                self.__outputs.remove(arg)
-
-        elif isinstance(arg, int):
-            if output_object := _outputs.get(arg, None):
-                if output_object in self.__outputs:
-                    self.__outputs.remove(output_object)
-
-        else:
+            arg = arg.id
+        elif not isinstance(arg, int):
             raise TypeError(
                 "output to remove must be a pawprints._LoggerOutput or an int"
             )
 
+        if self.__outputs.pop(arg, None) is not None:
+            self.__refresh_output_sends()
+
     def clear_outputs(self):
         """
         Clear (remove) all logger outputs from this Logger.
         """
 
-        self.__outputs = []
+        self.__outputs = {}
+        self.__output_sends = ()
 
     @property
     def name(self):
@@ -932,7 +1528,9 @@ class Logger:  # pylint: disable=too-many-instance-attributes
         :rtype: List[_LoggerOutput]
         """
 
-        return self.__outputs
+        # Return a copy so the outputs can only be changed through
+        # add_output/remove_output/clear_outputs, which keep the sends cache in sync
+        return list(self.__outputs.values())
 
     @property
     def id(self):
@@ -951,7 +1549,7 @@ class Logger:  # pylint: disable=too-many-instance-attributes
         The logging level being used by this Logger.
         """
 
-        return get_level_name(self.__level)
+        return _LEVEL_NAMES[self.__level]
 
     @level.setter
     def level(self, new):
@@ -959,7 +1557,7 @@ class Logger:  # pylint: disable=too-many-instance-attributes
         if level is None:
             raise ValueError("level must be a valid logging level (1-7)")
 
-        self.__level = new
+        self.__level = level
 
     @property
     def levelno(self):
@@ -985,8 +1583,48 @@ class Logger:  # pylint: disable=too-many-instance-attributes
         self.__enabled = new
 
 
-root = Logger("root", INFO)
-root.add_output(StreamOutput())
+_root_logger: List[Optional[Logger]] = [None]
+_root_lock = Lock()
+
+
+def _get_root():
+    """
+    Get the root Logger, creating it on first use.
+    The root Logger isn't created on import so programs that never log don't pay for it.
+
+    :return: The root Logger
+    :rtype: pawprints.Logger
+    """
+
+    root = _root_logger[0]
+    if root is None:
+        with _root_lock:
+            root = _root_logger[0]
+            if root is None:
+                root = _loggers.get("root", None)
+                if root is None:
+                    root = Logger("root", INFO)
+                    root.add_output(StreamOutput())
+                _root_logger[0] = root
+
+    return root
+
+
+def __getattr__(name):
+    """
+    Get module attributes that are created on first access (PEP 562).
+
+    :param name: Name of the attribute being accessed
+    :type name: str
+    :raises AttributeError: If the attribute does not exist
+    :return: The attribute's value
+    :rtype: Any
+    """
+
+    if name == "root":
+        return _get_root()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def config_root(
@@ -1012,6 +1650,8 @@ def config_root(
     # We don't need to type check most kwargs here since it's
     # already done in all of these setter methods.
 
+    root = _get_root()
+
     if level is not None:
         root.level = level
     if formatter is not None:
@@ -1040,6 +1680,8 @@ def reset_root():
     Reset the root Logger's config.
     """
 
+    root = _get_root()
+
     root.level = INFO
     root.formatter = default_formatter
     root.clear_outputs()
@@ -1058,8 +1700,9 @@ def log(message, level=NO_LEVEL_SET, /):
     :type level: int | str | pawprints._NoLogLevelSentinel, optional
     """
 
-    if level == NO_LEVEL_SET:
-        level = root.level
+    root = _get_root()
+    if level is NO_LEVEL_SET:
+        level = root.levelno
 
     root.log(message, level)
 
@@ -1072,7 +1715,7 @@ def debug(message, /):
     :type message: SupportsStr | SupportsRepr
     """
 
-    root.log(message, DEBUG)
+    _get_root().debug(message)
 
 
 def command_call(message, /):
@@ -1083,7 +1726,7 @@ def command_call(message, /):
     :type message: SupportsStr | SupportsRepr
     """
 
-    root.log(message, CMD_CALL)
+    _get_root().command_call(message)
 
 
 cmd_call = command_call
@@ -1097,7 +1740,7 @@ def info(message, /):
     :type message: SupportsStr | SupportsRepr
     """
 
-    root.log(message, INFO)
+    _get_root().info(message)
 
 
 def setup(message, /):
@@ -1108,7 +1751,7 @@ def setup(message, /):
     :type message: SupportsStr | SupportsRepr
     """
 
-    root.log(message, SETUP)
+    _get_root().setup(message)
 
 
 def warning(message, /):
@@ -1119,7 +1762,7 @@ def warning(message, /):
     :type message: SupportsStr | SupportsRepr
     """
 
-    root.log(message, WARNING)
+    _get_root().warning(message)
 
 
 warn = warning
@@ -1133,7 +1776,7 @@ def error(message, /):
     :type message: SupportsStr | SupportsRepr
     """
 
-    root.log(message, ERROR)
+    _get_root().error(message)
 
 
 def fatal(message, /):
@@ -1144,4 +1787,4 @@ def fatal(message, /):
     :type message: SupportsStr | SupportsRepr
     """
 
-    root.log(message, FATAL)
+    _get_root().fatal(message)
@@ -3,8 +3,10 @@
 import inspect
 import sys
 from typing import (
+    Callable,
     List,
     Literal,
+    NamedTuple,
     Optional,
     Protocol,
     Sequence,
@@ -25,6 +27,8 @@ from abc import abstractmethod
 
 DEFAULT_FORMAT: Literal["[{ftime}] [{level}] {name} - {message} ({filename}:{lineno})"]
 DEFAULT_TIMESTAMP_FORMAT: Literal["%Y-%m-%d %H:%M:%S"]
+DEFAULT_BATCH_SIZE: int
+DEFAULT_FLUSH_INTERVAL: float
 OpenTextWritingMode: TypeAlias = Literal[
     "r+",
     "+r",
@@ -78,6 +82,7 @@ def get_logger(name: str, /) -> Union[Logger, None]: ...
 
 class _NoLogLevelSentinel:
     __slots__: Tuple[()]
+    def __new__(cls) -> _NoLogLevelSentinel: ...
     def __eq__(self, other: object) -> bool: ...
     def __bool__(self) -> Literal[False]: ...
     def __hash__(self) -> Literal[0]: ...
@@ -112,14 +117,19 @@ def get_level_name(level: Union[int, str], /) -> Union[
     None,
 ]: ...
 
+class _FrameLocation(NamedTuple):
+    filename: str
+    lineno: int
+
 class LogMessage:
+    __slots__: Tuple[str, ...]
     def __init__(
         self,
         message: Union[SupportsStr, SupportsRepr],
         /,
         level: int | str,
         logger_name: str,
-        stack_frame: inspect.FrameInfo,
+        stack_frame: Union[inspect.FrameInfo, _FrameLocation],
     ) -> None: ...
     @property
     def message(self) -> str: ...
@@ -151,8 +161,11 @@ class LogMessage:
     def lineno(self) -> int: ...
     @property
     def time(self) -> float: ...
+    @property
+    def time_ns(self) -> int: ...
 
 class Formatter:
+    __slots__: Tuple[str, ...]
     def __init__(
         self,
         template: str,
@@ -176,6 +189,7 @@ class Formatter:
 default_formatter: Formatter
 
 class _LoggerOutput:
+    __slots__: Tuple[str, ...]
     def __init__(self) -> None: ...
     @abstractmethod
     def send(self, message: Union[SupportsStr, SupportsRepr], /) -> None: ...
@@ -183,20 +197,32 @@ class _LoggerOutput:
     def id(self) -> int: ...
 
 class StreamOutput(_LoggerOutput):
-    def __init__(self, stream: TextIO = sys.stderr, /) -> None: ...
+    __slots__: Tuple[str, ...]
+    def __init__(
+        self, stream: TextIO = sys.stderr, /, *, auto_flush: bool = True
+    ) -> None: ...
     def send(self, message: Union[SupportsStr, SupportsRepr], /) -> None: ...
+    def flush(self) -> None: ...
     @property
     def stream(self) -> TextIO: ...
+    @property
+    def auto_flush(self) -> bool: ...
 
 class FileOutput(_LoggerOutput):
+    __slots__: Tuple[str, ...]
     def __init__(
         self,
         filepath: str,
         mode: OpenTextWritingMode = "a",
         encoding: Optional[str] = None,
         errors: Optional[str] = None,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
     ) -> None: ...
     def send(self, message: Union[SupportsStr, SupportsRepr], /) -> None: ...
+    def flush(self) -> None: ...
+    def close(self) -> None: ...
     @property
     def filepath(self) -> str: ...
     @property
@@ -205,8 +231,13 @@ class FileOutput(_LoggerOutput):
     def encoding(self) -> Union[str, None]: ...
     @property
     def errors(self) -> Union[str, None]: ...
+    @property
+    def batch_size(self) -> int: ...
+    @property
+    def flush_interval(self) -> float: ...
 
 class Logger:
+    __slots__: Tuple[str, ...]
     def __init__(self, name: str, level: Union[int, str]) -> None: ...
     @overload
     def log(
@@ -228,6 +259,13 @@ class Logger:
     def warn(self, message: Union[SupportsStr, SupportsRepr], /) -> None: ...
     def error(self, message: Union[SupportsStr, SupportsRepr], /) -> None: ...
     def fatal(self, message: Union[SupportsStr, SupportsRepr], /) -> None: ...
+    def lazy_log(
+        self,
+        message_factory: Callable[[], Union[SupportsStr, SupportsRepr]],
+        level: Union[int, str, _NoLogLevelSentinel] = NO_LEVEL_SET,
+        /,
+    ) -> None: ...
+    def is_enabled_for(self, level: Union[int, str], /) -> bool: ...
     def add_output(self, output: _LoggerOutput, /) -> None: ...
     @overload
     def remove_output(self, output: _LoggerOutput, /) -> None: ...
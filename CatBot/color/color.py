@@ -7,15 +7,21 @@ Color assignment cog for CatBot.
 # pylint: disable=redefined-builtin
 
 import logging
+from functools import lru_cache
 from io import BytesIO
-from typing import Literal, Union
+from struct import pack
+from typing import Dict, Literal, Tuple, Union
+from zlib import compress, crc32
 
 import discord
 from discord import app_commands
 from discord.ext import commands
-from PIL import Image
 
-from ..CatBot_utils import emojis, generate_authored_embed_with_icon
+from ..CatBot_utils import (
+    emojis,
+    generate_authored_embed_with_icon,
+    generate_icon_file,
+)
 from .color_tools import (
     BLUES,
     BROWNS,
@@ -31,7 +37,6 @@ from .color_tools import (
     hex2rgb,
     invert_rgb,
     is_hex_value,
-    is_rgb_value,
     random_rgb,
     rgb2hex,
 )
@@ -54,24 +59,158 @@ def create_role_name(user: Union[discord.Member, discord.User], /) -> str:
     return f"{user.name}'s Color"
 
 
-def generate_color_image(hex: str) -> BytesIO:
+# Discord treats a role color of 0 as "no color"
+_EMPTY_COLOR = discord.Color(0)
+
+
+COLOR_IMAGE_SIZE = 100
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Width, height, bit depth 1, color type 3 (palette), default compression,
+# filter and interlace methods
+_COLOR_IMAGE_IHDR = pack(">IIBBBBB", COLOR_IMAGE_SIZE, COLOR_IMAGE_SIZE, 1, 3, 0, 0, 0)
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    """
+    Build a PNG chunk.
+
+    :param chunk_type: Four byte chunk type
+    :type chunk_type: bytes
+    :param data: Chunk data
+    :type data: bytes
+    :return: The chunk, with its length and CRC
+    :rtype: bytes
+    """
+
+    return (
+        pack(">I", len(data)) + chunk_type + data + pack(">I", crc32(chunk_type + data))
+    )
+
+
+# Every pixel of a color image is palette index 0, so only the palette differs between
+# colors and everything but the PLTE chunk is encoded once here
+_COLOR_IMAGE_HEAD = _PNG_SIGNATURE + _png_chunk(b"IHDR", _COLOR_IMAGE_IHDR)
+_COLOR_IMAGE_TAIL = _png_chunk(
+    b"IDAT",
+    # Every scanline is the filter type byte (0, no filter) followed by the 1 bit pixels
+    compress(bytes(1 + (COLOR_IMAGE_SIZE + 7) // 8) * COLOR_IMAGE_SIZE, 9),
+) + _png_chunk(b"IEND", b"")
+
+
+@lru_cache(maxsize=512)
+def _color_image_bytes(rgb: Tuple[int, int, int]) -> bytes:
+    """
+    Encode a solid color image as PNG bytes.
+    The PNG is built by hand, since a single color needs none of an image library's work.
+    Results are cached, since the same few colors tend to be requested repeatedly.
+
+    :param rgb: RGB value
+    :type rgb: Tuple[int, int, int]
+    :return: The PNG encoded color image
+    :rtype: bytes
+    """
+
+    return _COLOR_IMAGE_HEAD + _png_chunk(b"PLTE", bytes(rgb)) + _COLOR_IMAGE_TAIL
+
+
+def generate_color_image(rgb: Tuple[int, int, int]) -> BytesIO:
     """
     Generate a color image based on the value(s) provided.
 
-    :param hex: Hex code
-    :type hex: str
+    :param rgb: RGB value
+    :type rgb: Tuple[int, int, int]
     :return: The color image
     :rtype: BytesIO
     """
 
-    rgb = hex2rgb(hex)  # type: ignore
+    # Each caller gets its own stream over the shared (immutable) cached bytes
+    data = _PREDEFINED_COLOR_IMAGES.get(rgb)
+    if data is None:
+        data = _color_image_bytes(rgb)
+    return BytesIO(data)
+
+
+# Reverse lookup of COLORS; if a hex had several names, the first one would be kept
+_HEX_TO_COLOR_KEY: Dict[str, str] = {}
+for _key, _hex in COLORS.items():
+    _HEX_TO_COLOR_KEY.setdefault(_hex, _key)
+del _key, _hex
+
+# COLORS is static, so each name's RGB value and discord.Color are only parsed once
+_COLOR_RGBS: Dict[str, Tuple[int, int, int]] = {
+    name: hex2rgb(hex) for name, hex in COLORS.items()
+}
+_COLOR_OBJECTS: Dict[str, discord.Color] = {
+    name: discord.Color.from_rgb(*rgb) for name, rgb in _COLOR_RGBS.items()
+}
+
+# PNG bytes of every predefined color, so they never need encoding (or a cache slot)
+# while handling a command
+_PREDEFINED_COLOR_IMAGES: Dict[Tuple[int, int, int], bytes] = {
+    rgb: _color_image_bytes.__wrapped__(rgb) for rgb in _COLOR_RGBS.values()
+}
+
+
+_COLOR_GROUPS: Dict[str, Dict[str, str]] = {
+    "red": REDS,
+    "orange": ORANGES,
+    "yellow": YELLOWS,
+    "green": GREENS,
+    "blue": BLUES,
+    "purple": PURPLES,
+    "pink": PINKS,
+    "brown": BROWNS,
+    "white": WHITES,
+    "gray": GRAYS,
+}
+_COLOR_GROUP_ALIASES: Dict[str, str] = {"grey": "gray"}
+
+
+@lru_cache(maxsize=None)
+def _color_list_embed(group: str) -> discord.Embed:
+    """
+    Build and cache the /color color-list embed for `group`.
+    The color groups never change, and discord.py doesn't modify an embed when
+    sending it, so one embed per group is shared by every invocation.
+
+    :param group: Color group, possibly an alias
+    :type group: str
+    :return: The color list embed
+    :rtype: discord.Embed
+    """
+
+    key = _COLOR_GROUP_ALIASES.get(group, group)
 
-    # Create a 100x100 pixel image with the specified RGB color
-    img = Image.new("RGB", (100, 100), (rgb[0], rgb[1], rgb[2]))
-    img_byte_arr = BytesIO()
-    img.save(img_byte_arr, format="PNG")
-    img_byte_arr.seek(0)
-    return img_byte_arr
+    # The icon file is consumed when sent, so only the embed is kept
+    embed, _ = generate_authored_embed_with_icon(
+        embed_title=f"{emojis.ART_PALETTE} {group.title()} Colors",
+        embed_description=f"Here's a list of supported {group} color names.",
+        embed_color=_COLOR_OBJECTS[key],
+    )
+    embed.add_field(
+        name=f"{group.title()} Colors",
+        value="".join(
+            f"{name.title()}  -  #{value}\n"
+            for name, value in _COLOR_GROUPS[key].items()
+        ),
+    )
+
+    return embed
+
+
+def _normalize_hex(hex: str) -> str:
+    """
+    Normalize user provided hex input to its bare, lowercase form.
+    Handlers do this once up front, so the rest of the command (and the caches it hits)
+    always see the same key for the same color.
+
+    :param hex: Hex input
+    :type hex: str
+    :return: Normalized hex
+    :rtype: str
+    """
+
+    return hex.strip().strip("#").lower()
 
 
 def get_color_key(hex: str) -> Union[str, None]:
@@ -84,20 +223,80 @@ def get_color_key(hex: str) -> Union[str, None]:
     :rtype: Union[str, None]
     """
 
-    if hex in COLORS.values():
-        return [k for k, v in COLORS.items() if v == hex][0]
-    return None
+    return _HEX_TO_COLOR_KEY.get(hex.lstrip("#").lower())
+
+
+# Inverted hex, inverted RGB, inverted discord.Color, and the inverted color's key
+_InvertedColor = Tuple[str, Tuple[int, int, int], discord.Color, Union[str, None]]
+
+
+def _invert_color(hex: str) -> _InvertedColor:
+    """
+    Invert `hex`, also returning the inverted color's RGB value, discord.Color, and key.
+
+    :param hex: Hex code
+    :type hex: str
+    :return: The inverted hex, RGB, and discord.Color, and the inverted color's key if it exists
+    :rtype: _InvertedColor
+    """
+
+    # Flipping all 24 bits inverts every channel at once
+    value = int(hex, 16) ^ 0xFFFFFF
+    new_hex = f"{value:06x}"
+    rgb = (value >> 16, (value >> 8) & 0xFF, value & 0xFF)
+    return new_hex, rgb, discord.Color(value), get_color_key(new_hex)
+
+
+# Inverting a predefined color always gives the same result, so it's only done once
+_INVERTED_COLORS: Dict[str, _InvertedColor] = {
+    name: _invert_color(hex) for name, hex in COLORS.items()
+}
+
+
+@lru_cache(maxsize=None)
+def _inverted_color_name_embed(name: str) -> discord.Embed:
+    """
+    Build and cache the /color invert name embed for `name`.
+    Like the color list embeds, the result only depends on the predefined color,
+    so one embed per color is shared by every invocation.
+
+    :param name: Predefined color name
+    :type name: str
+    :return: The inverted color embed
+    :rtype: discord.Embed
+    """
+
+    hex = COLORS[name]
+    new_hex, rgb, new_color, key = _INVERTED_COLORS[name]
+
+    # The icon file is consumed when sent, so only the embed is kept
+    embed, _ = generate_authored_embed_with_icon(
+        embed_title=f"{emojis.ART_PALETTE} Inverted color of #{hex}",
+        embed_description="Here's your inverted color.",
+        embed_color=new_color,
+    )
+
+    embed.add_field(name="Hex", value=f"#{hex}")
+    embed.add_field(name="RGB", value=f"{rgb}")
+
+    if key:
+        embed.add_field(name="Color Name", value=key)
+
+    embed.set_image(url=f"attachment://{new_hex}.png")
+
+    return embed
 
 
 async def handle_forbidden_exception(interaction: discord.Interaction, /) -> None:
     """
     Execute this function on discord.Forbidden exceptions.
+    The interaction must have already been deferred.
 
     :param interaction: Interaction instance
     :type interaction: discord.Interaction
     """
 
-    await interaction.response.send_message(
+    await interaction.followup.send(
         f"{emojis.ERROR} I do not have permissions to create roles. "
         + "Contact server administration about this please!",
         ephemeral=True,
@@ -110,6 +309,7 @@ async def handle_http_exception(
 ) -> None:
     """
     Execute this function on discord.HTTPException exceptions.
+    The interaction must have already been deferred.
 
     :param interaction: Interaction instance
     :type interaction: discord.Interaction
@@ -117,7 +317,7 @@ async def handle_http_exception(
     :type err: discord.HTTPException
     """
 
-    await interaction.response.send_message(
+    await interaction.followup.send(
         f"{emojis.ERROR} An error occurred. Please try again.", ephemeral=True
     )
     logging.error("Failed to create role due to an unexpected error: %s", err)
@@ -130,6 +330,95 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
 
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
+        # Guild id -> user id -> id of the user's color role,
+        # so color role lookups don't need to scan all of a guild's roles
+        self._color_role_ids: Dict[int, Dict[int, int]] = {}
+
+    def _find_color_role(
+        self, interaction: discord.Interaction, /
+    ) -> Union[discord.Role, None]:
+        """
+        Find the color role of the user who invoked the interaction, if it exists.
+
+        :param interaction: Interaction instance
+        :type interaction: discord.Interaction
+        :return: The user's color role if it was found, otherwise None
+        :rtype: Union[discord.Role, None]
+        """
+
+        guild = interaction.guild
+        role_name = create_role_name(interaction.user)
+        role_ids = self._color_role_ids.setdefault(guild.id, {})  # type: ignore
+
+        role_id = role_ids.get(interaction.user.id)
+        if role_id is not None:
+            role = guild.get_role(role_id)  # type: ignore
+            # The user may have been renamed since the role was cached
+            if role is not None and role.name == role_name:
+                return role
+
+        role = find_existing_role(role_name, guild.roles)  # type: ignore
+        if role is None:
+            role_ids.pop(interaction.user.id, None)
+        else:
+            role_ids[interaction.user.id] = role.id
+        return role
+
+    def _forget_color_role(self, role: discord.Role, /) -> None:
+        """
+        Remove `role` from the color role cache.
+
+        :param role: Role to remove
+        :type role: discord.Role
+        """
+
+        role_ids = self._color_role_ids.get(role.guild.id)
+        if not role_ids:
+            return
+
+        for user_id, role_id in tuple(role_ids.items()):
+            if role_id == role.id:
+                del role_ids[user_id]
+
+    async def _apply_color(
+        self, interaction: discord.Interaction, color: discord.Color, label: str, /
+    ) -> None:
+        """
+        Give the user who invoked the interaction a color role with `color`.
+        Their existing color role is updated, or a new one is created if they have none.
+
+        :param interaction: Interaction instance
+        :type interaction: discord.Interaction
+        :param color: Color to apply
+        :type color: discord.Color
+        :param label: How to refer to the color in responses
+        :type label: str
+        """
+
+        existing_role = self._find_color_role(interaction)
+
+        # Editing or creating the role takes several API requests, which could outlast
+        # the 3 second window to respond in, so acknowledge the interaction first
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
+        if existing_role:
+            await edit_color_role(existing_role, color, interaction.user, label)  # type: ignore
+            await interaction.followup.send(
+                f"{emojis.CHECKMARK} Your role color has been updated to {label}.",
+                ephemeral=True,
+            )
+            return
+
+        try:
+            await create_color_role(interaction.user, color, interaction.guild)  # type: ignore
+            await interaction.followup.send(
+                f"{emojis.CHECKMARK} You have been assigned a role with the color {label}.",
+                ephemeral=True,
+            )
+        except discord.Forbidden:
+            await handle_forbidden_exception(interaction)
+        except discord.HTTPException as e:
+            await handle_http_exception(interaction, e)
 
     @commands.Cog.listener()
     async def on_ready(self) -> None:
@@ -139,6 +428,25 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
 
         logging.info("ColorCog loaded")
 
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        """
+        Drop deleted roles from the color role cache.
+        """
+
+        self._forget_color_role(role)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(
+        self, before: discord.Role, after: discord.Role
+    ) -> None:
+        """
+        Drop renamed roles from the color role cache.
+        """
+
+        if before.name != after.name:
+            self._forget_color_role(after)
+
     color_group = app_commands.Group(name="color", description="color commands")
     role_group = app_commands.Group(
         name="role",
@@ -170,6 +478,7 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
             "/color role hex hex=%s invoked by %s", repr(hex), interaction.user
         )
 
+        hex = _normalize_hex(hex)
         if not is_hex_value(hex):
             await interaction.response.send_message(
                 f"{emojis.X} Invalid hex value provided. Supported range: 000000-ffffff",
@@ -177,29 +486,8 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
             )
             return
 
-        color = discord.Color(int(hex.strip().strip("#"), 16))
-        existing_role = find_existing_role(
-            create_role_name(interaction.user), interaction.guild.roles  # type: ignore
-        )
-
-        if existing_role:
-            await edit_color_role(existing_role, color, interaction.user, hex)  # type: ignore
-            await interaction.response.send_message(
-                f"{emojis.CHECKMARK} Your role color has been updated to {hex}.",
-                ephemeral=True,
-            )
-            return
-
-        try:
-            await create_color_role(interaction.user, color, interaction.guild)  # type: ignore
-            await interaction.response.send_message(
-                f"{emojis.CHECKMARK} You have been assigned a role with the color {hex}.",
-                ephemeral=True,
-            )
-        except discord.Forbidden:
-            await handle_forbidden_exception(interaction)
-        except discord.HTTPException as e:
-            await handle_http_exception(interaction, e)
+        color = discord.Color(int(hex, 16))
+        await self._apply_color(interaction, color, hex)
 
     @role_group.command(
         name="rgb", description="Assign yourself a custom color role with RGB"
@@ -219,7 +507,8 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
             "/color role rgb r=%s g=%s b=%s invoked by %s", r, g, b, interaction.user
         )
 
-        if not all(is_rgb_value(v) for v in (r, g, b)):
+        # Any bit above the low 8 (including the sign of a negative) means out of range
+        if (r | g | b) & ~0xFF:
             await interaction.response.send_message(
                 f"{emojis.X} Invalid RGB value provided. Supported range: 0-255",
                 ephemeral=True,
@@ -227,28 +516,7 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
             return
 
         color = discord.Color.from_rgb(r, g, b)
-        existing_role = find_existing_role(
-            create_role_name(interaction.user), interaction.guild.roles  # type: ignore
-        )
-
-        if existing_role:
-            await edit_color_role(existing_role, color, interaction.user, (r, g, b))  # type: ignore
-            await interaction.response.send_message(
-                f"{emojis.CHECKMARK} Your role color has been updated to {(r, g, b)}.",
-                ephemeral=True,
-            )
-            return
-
-        try:
-            await create_color_role(interaction.user, color, interaction.guild)  # type: ignore
-            await interaction.response.send_message(
-                f"{emojis.CHECKMARK} You have been assigned a role with the color {(r, g, b)}.",
-                ephemeral=True,
-            )
-        except discord.Forbidden:
-            await handle_forbidden_exception(interaction)
-        except discord.HTTPException as e:
-            await handle_http_exception(interaction, e)
+        await self._apply_color(interaction, color, str((r, g, b)))
 
     @role_group.command(
         name="name", description="Assign yourself a custom color with a color name"
@@ -268,7 +536,8 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
             "/color role name name=%s invoked by %s", repr(name), interaction.user
         )
 
-        if name not in COLORS:
+        color = _COLOR_OBJECTS.get(name)
+        if color is None:
             await interaction.response.send_message(
                 f"{emojis.X} Invalid color name provided. "
                 + "Use /color-list for a list of supported colors.",
@@ -276,29 +545,7 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
             )
             return
 
-        color = discord.Color(int(COLORS[name], 16))
-        existing_role = find_existing_role(
-            create_role_name(interaction.user), interaction.guild.roles  # type: ignore
-        )
-
-        if existing_role:
-            await edit_color_role(existing_role, color, interaction.user, color)  # type: ignore
-            await interaction.response.send_message(
-                f"{emojis.CHECKMARK} Your role color has been updated to {name}.",
-                ephemeral=True,
-            )
-            return
-
-        try:
-            await create_color_role(interaction.user, color, interaction.guild)  # type: ignore
-            await interaction.response.send_message(
-                f"{emojis.CHECKMARK} You have been assigned a role with the color {name}.",
-                ephemeral=True,
-            )
-        except discord.Forbidden:
-            await handle_forbidden_exception(interaction)
-        except discord.HTTPException as e:
-            await handle_http_exception(interaction, e)
+        await self._apply_color(interaction, color, name)
 
     @role_group.command(name="random", description="Assign yourself a random color")
     @app_commands.describe(seed="Optional seed to use when generating the color")
@@ -314,28 +561,7 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
 
         r, g, b = random_rgb(seed=seed)
         color = discord.Color.from_rgb(r, g, b)
-        existing_role = find_existing_role(
-            create_role_name(interaction.user), interaction.guild.roles  # type: ignore
-        )
-
-        if existing_role:
-            await edit_color_role(existing_role, color, interaction.user, (r, g, b))  # type: ignore
-            await interaction.response.send_message(
-                f"{emojis.CHECKMARK} Your role color has been updated to {(r, g, b)}.",
-                ephemeral=True,
-            )
-            return
-
-        try:
-            await create_color_role(interaction.user, color, interaction.guild)  # type: ignore
-            await interaction.response.send_message(
-                f"{emojis.CHECKMARK} You have been assigned a role with color {(r, g, b)}.",
-                ephemeral=True,
-            )
-        except discord.Forbidden:
-            await handle_forbidden_exception(interaction)
-        except discord.HTTPException as e:
-            await handle_http_exception(interaction, e)
+        await self._apply_color(interaction, color, str((r, g, b)))
 
     @role_group.command(
         name="copy-color", description="Copy a role's color and assign it to yourself"
@@ -353,37 +579,14 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
             "/color role copy-color role=%s invoked by %s", role, interaction.user
         )
 
-        if role not in interaction.guild.roles:  # type: ignore
+        if role.guild.id != interaction.guild.id:  # type: ignore
             await interaction.response.send_message(
                 f"{emojis.X} The role was not found in this guild.", ephemeral=True
             )
             return
 
         color = role.color
-        existing_role = find_existing_role(
-            create_role_name(interaction.user), interaction.guild.roles  # type: ignore
-        )
-
-        if existing_role:
-            await edit_color_role(
-                existing_role, color, interaction.user, (color.r, color.g, color.b)  # type: ignore
-            )
-            await interaction.response.send_message(
-                f"{emojis.CHECKMARK} Your role color has been updated to {(color.r, color.g, color.b)}.",
-                ephemeral=True,
-            )
-            return
-
-        try:
-            await create_color_role(interaction.user, color, interaction.guild)  # type: ignore
-            await interaction.response.send_message(
-                f"{emojis.CHECKMARK} You have been assigned a role with color {(color.r, color.g, color.b)}.",
-                ephemeral=True,
-            )
-        except discord.Forbidden:
-            await handle_forbidden_exception(interaction)
-        except discord.HTTPException as e:
-            await handle_http_exception(interaction, e)
+        await self._apply_color(interaction, color, str((color.r, color.g, color.b)))
 
     @role_group.command(
         name="reset", description="Reset your color to the default (empty) color"
@@ -395,9 +598,7 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
 
         logging.info("/color role reset invoked by %s", interaction.user)
 
-        existing_role = find_existing_role(
-            create_role_name(interaction.user), interaction.guild.roles  # type: ignore
-        )
+        existing_role = self._find_color_role(interaction)
 
         if not existing_role:
             await interaction.response.send_message(
@@ -405,7 +606,8 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
             )
             return
 
-        await existing_role.edit(color=discord.Color(int("000000", 16)))
+        if existing_role.color != _EMPTY_COLOR:
+            await existing_role.edit(color=_EMPTY_COLOR)
         await interaction.response.send_message(
             f"{emojis.CHECKMARK} Your role's color has been reset.", ephemeral=True
         )
@@ -421,9 +623,7 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
 
         logging.info("/color role reassign invoked by %s", interaction.user)
 
-        existing_role = find_existing_role(
-            create_role_name(interaction.user), interaction.guild.roles  # type: ignore
-        )
+        existing_role = self._find_color_role(interaction)
 
         if not existing_role:
             await interaction.response.send_message(
@@ -469,40 +669,14 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
         Provide a list of supported color names.
         """
 
-        group_map = {
-            "red": REDS,
-            "orange": ORANGES,
-            "yellow": YELLOWS,
-            "green": GREENS,
-            "blue": BLUES,
-            "purple": PURPLES,
-            "pink": PINKS,
-            "brown": BROWNS,
-            "white": WHITES,
-            "gray": GRAYS,
-            "grey": GRAYS,
-        }
-
         logging.info(
             "/color color-list group=%s invoked by %s", group, interaction.user
         )
 
-        colors = group_map[group]
-
-        embed, icon = generate_authored_embed_with_icon(
-            embed_title=f"{emojis.ART_PALETTE} {group.title()} Colors",
-            embed_description=f"Here's a list of supported {group} color names.",
-            embed_color=discord.Color(int(colors[group], 16)),
+        await interaction.response.send_message(
+            embed=_color_list_embed(group), file=generate_icon_file()
         )
 
-        colors_str = ""
-        for name_, value in colors.items():
-            colors_str += f"{name_.title()}  -  #{value}\n"
-
-        embed.add_field(name=f"{group.title()} Colors", value=colors_str)
-
-        await interaction.response.send_message(embed=embed, file=icon)
-
     @info_group.command(name="rgb", description="Get info about an RGB color")
     @app_commands.describe(
         r="Red value (0-255)", g="Green value (0-255)", b="Blue value (0-255)"
@@ -518,7 +692,8 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
             "/color info rgb r=%s g=%s b=%s invoked by %s", r, g, b, interaction.user
         )
 
-        if not all(is_rgb_value(v) for v in (r, g, b)):
+        # Any bit above the low 8 (including the sign of a negative) means out of range
+        if (r | g | b) & ~0xFF:
             await interaction.response.send_message(
                 f"{emojis.X} Invalid RGB value provided. Supported range: 0-255",
                 ephemeral=True,
@@ -526,7 +701,7 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
             return
 
         hex = rgb2hex(r, g, b)
-        image = generate_color_image(hex)
+        image = generate_color_image((r, g, b))
         filename = f"{hex}.png"
         file = discord.File(fp=image, filename=filename)
 
@@ -557,6 +732,7 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
             "/color info hex hex=%s invoked by %s", repr(hex), interaction.user
         )
 
+        hex = _normalize_hex(hex)
         if not is_hex_value(hex):
             await interaction.response.send_message(
                 f"{emojis.X} Invalid hex value provided. Supported range: 000000-ffffff",
@@ -564,16 +740,17 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
             )
             return
 
-        hex = hex.strip("#").lower()
-        r, g, b = hex2rgb(hex)
-        image = generate_color_image(hex)
+        # Parse the validated hex once; the components are unpacked from the same int
+        color = discord.Color(int(hex, 16))
+        r, g, b = color.to_rgb()
+        image = generate_color_image((r, g, b))
         filename = f"{hex}.png"
         file = discord.File(fp=image, filename=filename)
 
         embed, icon = generate_authored_embed_with_icon(
             embed_title=f"{emojis.ART_PALETTE} #{hex} Info",
             embed_description="Here's some information about your color.",
-            embed_color=discord.Color.from_rgb(r, g, b),
+            embed_color=color,
         )
 
         embed.add_field(name="RGB", value=f"{(r, g, b)}")
@@ -601,7 +778,8 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
 
         name = name.lower()
 
-        if name not in COLORS:
+        hex = COLORS.get(name)
+        if hex is None:
             await interaction.response.send_message(
                 f"{emojis.X} Invalid color name provided. "
                 + "Use /color color-list for a list of supported colors",
@@ -609,16 +787,15 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
             )
             return
 
-        hex = COLORS[name]
-        r, g, b = hex2rgb(hex)
-        image = generate_color_image(hex)
+        r, g, b = _COLOR_RGBS[name]
+        image = generate_color_image((r, g, b))
         filename = f"{hex}.png"
         file = discord.File(fp=image, filename=filename)
 
         embed, icon = generate_authored_embed_with_icon(
             embed_title=f"{emojis.ART_PALETTE} {name.title()} Info",
             embed_description="Here's some information about your color.",
-            embed_color=discord.Color.from_rgb(r, g, b),
+            embed_color=_COLOR_OBJECTS[name],
         )
 
         embed.add_field(name="Hex", value=f"#{hex}")
@@ -638,7 +815,7 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
 
         logging.info("/color info role role=%s invoked by %s", role, interaction.user)
 
-        if role not in interaction.guild.roles:  # type: ignore
+        if role.guild.id != interaction.guild.id:  # type: ignore
             await interaction.response.send_message(
                 f"{emojis.X} The role was not found in this guild.", ephemeral=True
             )
@@ -646,7 +823,7 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
 
         r, g, b = role.color.r, role.color.g, role.color.b
         hex = rgb2hex(r, g, b)
-        image = generate_color_image(hex)
+        image = generate_color_image((r, g, b))
         filename = f"{hex}.png"
         file = discord.File(fp=image, filename=filename)
 
@@ -681,7 +858,7 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
         r, g, b = random_rgb(seed=seed)
         hex = rgb2hex(r, g, b)
 
-        image = generate_color_image(hex)
+        image = generate_color_image((r, g, b))
         filename = f"{hex}.png"
         file = discord.File(fp=image, filename=filename)
 
@@ -717,7 +894,8 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
             "/color invert rgb r=%s g=%s b=%s invoked by %s", r, g, b, interaction.user
         )
 
-        if not all(is_rgb_value(v) for v in (r, g, b)):
+        # Any bit above the low 8 (including the sign of a negative) means out of range
+        if (r | g | b) & ~0xFF:
             await interaction.response.send_message(
                 f"{emojis.X} Invalid RGB value provided. Supported range: 0-255",
                 ephemeral=True,
@@ -727,7 +905,7 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
         nr, ng, nb = invert_rgb(r, g, b)
         hex = rgb2hex(nr, ng, nb)
 
-        image = generate_color_image(hex)
+        image = generate_color_image((nr, ng, nb))
         filename = f"{hex}.png"
         file = discord.File(fp=image, filename=filename)
 
@@ -759,6 +937,7 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
             "/color invert hex hex=%s invoked by %s", repr(hex), interaction.user
         )
 
+        hex = _normalize_hex(hex)
         if not is_hex_value(hex):
             await interaction.response.send_message(
                 f"{emojis.X} Invalid hex value provided. Supported range: 000000-ffffff",
@@ -766,19 +945,16 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
             )
             return
 
-        hex = hex.strip("#").lower()
-        rgb = hex2rgb(hex)
-        nr, ng, nb = invert_rgb(*rgb)
-        new_hex = rgb2hex(nr, ng, nb)
+        new_hex, (nr, ng, nb), new_color, _ = _invert_color(hex)
 
-        image = generate_color_image(new_hex)
+        image = generate_color_image((nr, ng, nb))
         filename = f"{new_hex}.png"
         file = discord.File(fp=image, filename=filename)
 
         embed, icon = generate_authored_embed_with_icon(
             embed_title=f"{emojis.ART_PALETTE} Inverted color of #{hex}",
             embed_description="Here's your inverted color.",
-            embed_color=discord.Color.from_rgb(nr, ng, nb),
+            embed_color=new_color,
         )
 
         embed.add_field(name="Hex", value=f"#{hex}")
@@ -807,39 +983,22 @@ class ColorCog(commands.Cog, name="Color Role Commands"):
 
         name = name.lower()
 
-        if name not in COLORS:
+        inverted = _INVERTED_COLORS.get(name)
+        if inverted is None:
             await interaction.response.send_message(
                 f"{emojis.X} Invalid color name provided. Use /color-list for a list of supported colors",
                 ephemeral=True,
             )
             return
 
-        hex = COLORS[name]
-        rgb = hex2rgb(hex)
-        nr, ng, nb = invert_rgb(*rgb)
-        new_hex = rgb2hex(nr, ng, nb)
+        new_hex, rgb, _, _ = inverted
+        file = discord.File(fp=generate_color_image(rgb), filename=f"{new_hex}.png")
 
-        image = generate_color_image(new_hex)
-        filename = f"{new_hex}.png"
-        file = discord.File(fp=image, filename=filename)
-
-        embed, icon = generate_authored_embed_with_icon(
-            embed_title=f"{emojis.ART_PALETTE} Inverted color of #{hex}",
-            embed_description="Here's your inverted color.",
-            embed_color=discord.Color.from_rgb(nr, ng, nb),
+        await interaction.response.send_message(
+            embed=_inverted_color_name_embed(name),
+            files=(file, generate_icon_file()),
         )
 
-        embed.add_field(name="Hex", value=f"#{hex}")
-        embed.add_field(name="RGB", value=f"{(nr, ng, nb)}")
-
-        key = get_color_key(new_hex)
-        if key:
-            embed.add_field(name="Color Name", value=key)
-
-        embed.set_image(url=f"attachment://{filename}")
-
-        await interaction.response.send_message(embed=embed, files=(file, icon))
-
 
 async def setup(bot: commands.Bot):
     """
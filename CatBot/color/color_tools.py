@@ -7,12 +7,11 @@ Color constants.
 # immense use of variable name 'hex'
 # pylint: disable=redefined-builtin
 
+import re
 from random import randint
 from random import seed as set_seed
-from re import match
 from typing import Tuple, Union
 
-
 REDS = {
     "indian red": "cd5c5c",
     "light coral": "f08080",
@@ -194,6 +193,9 @@ COLORS.update(WHITES)
 COLORS.update(GRAYS)
 
 
+_HEX_PATTERN = re.compile(r"[A-Fa-f0-9]{6}")
+
+
 def is_hex_value(hex: str) -> bool:
     """
     Determine if `hex` is a valid hex value.
@@ -204,7 +206,7 @@ def is_hex_value(hex: str) -> bool:
     :rtype: bool
     """
 
-    return bool(match(r"^[A-Fa-f0-9]{6}$", hex.strip("#")))
+    return _HEX_PATTERN.fullmatch(hex.strip("#")) is not None
 
 
 def is_rgb_value(value: int) -> bool:
@@ -237,7 +239,7 @@ def random_rgb(*, seed: Union[str, None] = None) -> Tuple[int, int, int]:
 
 def invert_rgb(r: int, g: int, b: int) -> Tuple[int, int, int]:
     """
-    Invert `r`, `g`, and `b`.
+    Invert `r`, `g`, and `b`, which should each be in the range 0-255.
 
     :param r: Red value
     :type r: int
@@ -249,7 +251,7 @@ def invert_rgb(r: int, g: int, b: int) -> Tuple[int, int, int]:
     :rtype: tuple[int, int, int]
     """
 
-    return abs(255 - r), abs(255 - g), abs(255 - b)
+    return r ^ 0xFF, g ^ 0xFF, b ^ 0xFF
 
 
 def invert_hex(hex: str) -> str:
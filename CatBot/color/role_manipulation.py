@@ -29,7 +29,7 @@ async def move_role_to_top(guild: discord.Guild, role: discord.Role) -> None:
 
             # Refresh roles after change
             await guild.fetch_roles()  # Re-fetch roles to ensure changes are reflected
-            updated_role = discord.utils.get(guild.roles, id=role.id)
+            updated_role = guild.get_role(role.id)
 
             # Double-check if the role is in the correct position
             if updated_role.position == bot_highest_role.position - 1:  # type: ignore
@@ -75,6 +75,7 @@ async def edit_color_role(
 ) -> None:
     """
     Edit the given role to match the color and assign it to the user if necessary.
+    The role is only edited if its color actually changes, to save an API request.
 
     :param role: Role to edit
     :type role: discord.Role
@@ -86,15 +87,16 @@ async def edit_color_role(
     :type color_repr: str | tuple[int, int, int]
     """
 
-    await role.edit(color=color)
-    logging.info(
-        "Role %s exists and its color has been changed to %s",
-        role.name,
-        color_repr,
-    )
+    if role.color != color:
+        await role.edit(color=color)
+        logging.info(
+            "Role %s exists and its color has been changed to %s",
+            role.name,
+            color_repr,
+        )
 
     # If the user somehow lost their role, readd it
-    if role not in user.roles:
+    if user.get_role(role.id) is None:
         await user.add_roles(role)
 
 
@@ -14,10 +14,8 @@ from sys import version_info
 from typing import List, Optional
 
 import discord
-import requests
 from discord import app_commands
 from discord.ext import commands
-from psutil import Process
 
 from ..CatBot_utils import (
     CAT_API_SEARCH_LINK,
@@ -94,6 +92,8 @@ class FunCog(commands.Cog, name="Fun Commands"):
         # And microseconds.
         microseconds = uptime.microseconds % MICROSECONDS_PER_SECOND
 
+        from psutil import Process  # pylint: disable=import-outside-toplevel
+
         memory_usage = Process().memory_info().rss / 1024**2  # bytes -> MiB
         host = platform()
         python_version = (
@@ -224,6 +224,8 @@ class FunCog(commands.Cog, name="Fun Commands"):
 
         await interaction.response.defer(thinking=True)
 
+        import requests  # pylint: disable=import-outside-toplevel
+
         response = requests.get(
             CAT_API_SEARCH_LINK, headers={"x-api-key": CAT_API_KEY}, timeout=10
         )
@@ -4,9 +4,10 @@ Main file.
 """
 
 import logging
-from asyncio import run
-
-import discord
+import os
+from argparse import Namespace
+from asyncio import Event, gather, run
+from typing import TYPE_CHECKING
 
 from CatBot.CatBot_utils import (
     LOG_FILE,
@@ -17,77 +18,126 @@ from CatBot.CatBot_utils import (
     initialize_cli_arg_parser,
 )
 
-bot = initialize_bot()
-parser = initialize_cli_arg_parser()
-cli_args = parser.parse_args()
+# discord.py is only imported once the CLI args have been parsed
+# (initialize_bot imports it), so `--help` and bad args exit without paying for it
+if TYPE_CHECKING:
+    import discord
+    from discord.ext.commands import Bot
+
+EXTENSIONS = (
+    "CatBot.color.color",
+    "CatBot.date_time.date_time",
+    "CatBot.fun.fun",
+    "CatBot.help.help",
+    "CatBot.management.management",
+    "CatBot.management.moderation",
+    "CatBot.math.maths",
+    "CatBot.math.stats",
+    "CatBot.rand.rand",
+)
+TESTING_EXTENSIONS = ("CatBot.experiments.experimental",)
 
 
-@bot.event
-async def on_ready() -> None:
+def register_events(bot: "Bot", cli_args: Namespace, /) -> None:
     """
-    Sync and register slash commands.
+    Register the bot's event and error handlers.
+
+    :param bot: Bot to register the handlers on
+    :type bot: Bot
+    :param cli_args: Parsed CLI args
+    :type cli_args: Namespace
     """
 
-    await bot.tree.sync()
+    # on_ready fires again after reconnects, but slash commands only need syncing once
+    commands_synced = Event()
 
-    if cli_args.testing:
-        await bot.change_presence(activity=discord.Game(name="⚠ TESTING ⚠"))
-        logging.warning(
-            "The application has been started in testing mode; ignore if this is intentional"
-        )
-    else:
-        await bot.change_presence(activity=discord.Game(name="/help"))
+    @bot.event
+    async def on_ready() -> None:
+        """
+        Sync and register slash commands.
+        """
 
-    logging.info("Logged in as %s and slash commands synced", bot.user.name)  # type: ignore
-    logging.info("---------------------------------------------")
+        import discord  # pylint: disable=import-outside-toplevel
 
+        if not commands_synced.is_set():
+            await bot.tree.sync()
+            commands_synced.set()
 
-@bot.tree.error
-async def on_app_command_error(
-    interaction: discord.Interaction, error: Exception
-) -> None:
-    """
-    Command error handler.
+        if cli_args.testing:
+            await bot.change_presence(activity=discord.Game(name="⚠ TESTING ⚠"))
+            logging.warning(
+                "The application has been started in testing mode; ignore if this is intentional"
+            )
+        else:
+            await bot.change_presence(activity=discord.Game(name="/help"))
 
-    :param interaction: Interaction instance
-    :type interaction: discord.Interaction
-    :param error: Error that occurred
-    :type error: Exception
-    """
+        logging.info("Logged in as %s and slash commands synced", bot.user.name)  # type: ignore
+        logging.info("---------------------------------------------")
 
-    await handle_app_command_error(interaction, error)
+    @bot.tree.error
+    async def on_app_command_error(
+        interaction: "discord.Interaction", error: Exception
+    ) -> None:
+        """
+        Command error handler.
 
+        :param interaction: Interaction instance
+        :type interaction: discord.Interaction
+        :param error: Error that occurred
+        :type error: Exception
+        """
 
-async def setup() -> None:
+        await handle_app_command_error(interaction, error)
+
+
+async def setup(bot: "Bot", cli_args: Namespace, /) -> None:
     """
     Reset logs and load necessary cogs.
+
+    :param bot: Bot to load the cogs into
+    :type bot: Bot
+    :param cli_args: Parsed CLI args
+    :type cli_args: Namespace
     """
 
-    with open(LOG_FILE, "w", encoding="utf8"):
-        logging.info("Log file %s cleared", LOG_FILE)
+    # Only truncate the log file if there is something to clear
+    try:
+        log_file_size = os.stat(LOG_FILE).st_size
+    except FileNotFoundError:
+        log_file_size = 0
+    if log_file_size:
+        os.truncate(LOG_FILE, 0)
+    logging.info("Log file %s cleared", LOG_FILE)
 
-    if cli_args.testing:
-        await bot.load_extension("CatBot.experiments.experimental")
+    extensions = TESTING_EXTENSIONS + EXTENSIONS if cli_args.testing else EXTENSIONS
 
-    await bot.load_extension("CatBot.color.color")
-    await bot.load_extension("CatBot.date_time.date_time")
-    await bot.load_extension("CatBot.fun.fun")
-    await bot.load_extension("CatBot.help.help")
-    await bot.load_extension("CatBot.management.management")
-    await bot.load_extension("CatBot.management.moderation")
-    await bot.load_extension("CatBot.math.maths")
-    await bot.load_extension("CatBot.math.stats")
-    await bot.load_extension("CatBot.rand.rand")
+    # Load the extensions concurrently, then report every failure instead of just the first
+    results = await gather(
+        *(bot.load_extension(extension) for extension in extensions),
+        return_exceptions=True,
+    )
+    errors = []
+    for extension, result in zip(extensions, results):
+        if isinstance(result, BaseException):
+            logging.error("Failed to load extension %s", extension, exc_info=result)
+            errors.append(result)
+
+    if errors:
+        raise errors[0]
 
 
 def main():
     """
-    Config logging, run setup, and run the bot.
+    Parse CLI args, config logging, run setup, and run the bot.
     """
 
-    config_logging(parser)
-    run(setup())
-    bot.run(get_token(parser))
+    cli_args = initialize_cli_arg_parser().parse_args()
+    config_logging(cli_args)
+
+    bot = initialize_bot(member_intents=not cli_args.nomemberintents)
+    register_events(bot, cli_args)
+    run(setup(bot, cli_args))
+    bot.run(get_token(cli_args))
 
 
 if __name__ == "__main__":
@@ -1,10 +1,14 @@
 # pylint: disable=all
 
+import gc
+import os
+import subprocess
+import sys
 from datetime import datetime
 from io import StringIO
 from inspect import stack
 from os import remove
-from time import time
+from time import time_ns
 
 import pytest
 
@@ -47,6 +51,20 @@ def test_root_logging_functions():
         ), f"Failed for {log_func.__name__}, got: {repr(output)}"
 
 
+def test_stream_output():
+    stream = StringIO()
+    stream_output = pawprints.StreamOutput(stream, auto_flush=False)
+    assert stream_output.stream is stream
+    assert stream_output.auto_flush is False
+
+    stream_output.send("stream output test\n")
+    stream_output.flush()
+    assert stream.getvalue() == "stream output test\n"
+
+    with pytest.raises(TypeError):
+        pawprints.StreamOutput(stream, auto_flush=1)
+
+
 def test_file_output():
     pawprints.reset_root()
 
@@ -54,10 +72,12 @@ def test_file_output():
 
     pawprints.config_root(outputs=[file_output])
     pawprints.info("file logging test")
+    file_output.flush()
 
     with open("log_file.log", encoding="utf8") as file:
         assert "file logging test" in file.read()
 
+    file_output.close()
     remove("log_file.log")
 
     assert file_output.encoding is None
@@ -65,6 +85,49 @@ def test_file_output():
     assert file_output.filepath == "log_file.log"
     assert file_output.open_text_mode == "a"
 
+    with pytest.raises(FileNotFoundError):
+        pawprints.FileOutput("nonexistent_dir/log_file.log")
+
+
+def test_file_output_failed_write(monkeypatch):
+    file_output = pawprints.FileOutput("log_file.log", "w", flush_interval=60)
+    real_write = os.write
+    writes = []
+
+    def failing_write(fd, data):
+        if bytes(data).startswith((b"AAAA", b"BBBB")):
+            writes.append(bytes(data))
+            if len(writes) == 1:  # Only part of the data gets written
+                return real_write(fd, data[:5])
+            if len(writes) == 2:
+                raise OSError(28, "No space left on device")
+        return real_write(fd, data)
+
+    monkeypatch.setattr(os, "write", failing_write)
+    file_output.send("AAAA\n")
+    file_output.send("BBBB\n")
+    with pytest.raises(OSError):
+        file_output.flush()
+    file_output.flush()  # Retries only what wasn't written
+    file_output.close()
+
+    with open("log_file.log", encoding="utf8") as file:
+        assert file.read() == "AAAA\nBBBB\n"
+    remove("log_file.log")
+
+
+def test_file_output_dropped():
+    file_output = pawprints.FileOutput("log_file.log", "w", flush_interval=60)
+    file_output.send("dropped\n")
+    del file_output
+    gc.collect()
+
+    # A dropped output is flushed and closed, and the flusher no longer holds it
+    with open("log_file.log", encoding="utf8") as file:
+        assert file.read() == "dropped\n"
+    assert not pawprints.pawprints._file_outputs
+    remove("log_file.log")
+
 
 def test_formatter():
     pawprints.reset_root()
@@ -134,6 +197,17 @@ def test_get_logger():
     assert pawprints.get_logger(1, "secondary") == None
 
 
+def test_get_logger_before_root_access():
+    # The root Logger is created lazily, so check it in a fresh interpreter
+    code = (
+        "from CatBot.CatBot_utils.pawprints import pawprints; "
+        + "assert pawprints.get_logger(0) is not None; "
+        + "assert pawprints.get_logger('root') is pawprints.get_logger(0); "
+        + "assert pawprints.get_logger(0, 'root') is pawprints.root"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
 def test_logger():
     logger = pawprints.Logger("secondary", pawprints.INFO)
     formatter = pawprints.Formatter("{message}")
@@ -163,15 +237,30 @@ def test_logger():
     assert logger.level == "DEBUG"
     assert logger.levelno == 1
     assert logger.enabled is True
+    assert logger.is_enabled_for(pawprints.DEBUG) is True
+    logger.level = "WARNING"
+    assert logger.levelno == 5
+    assert logger.is_enabled_for(pawprints.INFO) is False
+    assert logger.is_enabled_for("ERROR") is True
+    lazy_stream = StringIO()
+    logger.add_output(pawprints.StreamOutput(lazy_stream))
+    logger.lazy_log(lambda: pytest.fail("message built for a disabled level"), "INFO")
+    logger.lazy_log(lambda: "lazy log test", pawprints.ERROR)
+    assert lazy_stream.getvalue() == "lazy log test\n"
+    logger.clear_outputs()
     logger.enabled = False
     assert logger.enabled is False
+    assert logger.is_enabled_for(pawprints.FATAL) is False
+    file_output.close()
+    remove("log_file.log")
 
 
 def test_log_message():
+    time_before = time_ns()
     log_msg = pawprints.LogMessage(
         "Something is wrong!", pawprints.FATAL, "root", stack()[0]
     )
-    current_time = time()
+    time_after = time_ns()
 
     assert log_msg.filename == "test_pawprints.py"
     # We don't test full filepath here since it will vary from machine to machine.
@@ -181,11 +270,12 @@ def test_log_message():
     # Update this to whatever lineno the line containing
     # "Something is wrong!", pawprints.FATAL, "root", stack()[0]
     # has if test fails here.
-    assert log_msg.lineno == 172
+    assert log_msg.lineno == 261
     assert log_msg.logger_name == "root"
     assert log_msg.message == "Something is wrong!"
     assert log_msg.module == "test_pawprints"
-    assert log_msg.time == current_time
+    assert time_before <= log_msg.time_ns <= time_after
+    assert log_msg.time == log_msg.time_ns / 1e9
 
 
 if __name__ == "__main__":